@@ -0,0 +1,61 @@
+"""Benchmark the bit reversal kernels against the original unpackbits version.
+
+Run with ``python benchmarks/bench_reverse_bits.py [rows]``.
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+# Import `measurand` from this checkout, rather than any installed version
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from measurand.utils import (
+    _reverse_bits_ndarray,
+    _reverse_bits_numba,
+    _size_to_uint,
+)
+
+
+def _reverse_bits_unpackbits(x: np.ndarray, size: int) -> np.ndarray:
+    # The original implementation, kept as the baseline
+    tmp = np.ascontiguousarray(x)
+    dtype = x.dtype
+    result = np.flip(
+        np.ascontiguousarray(
+            np.packbits(np.flip(np.unpackbits(tmp.view(np.uint8))))
+        ).view(dtype)
+    )
+    shift = result.dtype.itemsize * 8 - size
+    if shift:
+        result = np.right_shift(result, np.uint8(shift))
+    return result
+
+
+KERNELS = {
+    "unpackbits": _reverse_bits_unpackbits,
+    "lookup": _reverse_bits_ndarray,
+    "numba": _reverse_bits_numba,
+}
+
+
+def main(rows: int = 1_000_000, repeat: int = 5) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'bits':>4} " + " ".join(f"{name:>12}" for name in KERNELS))
+    for size in (8, 16, 32, 64):
+        data = rng.integers(0, 2**size, rows, dtype=_size_to_uint(size))
+        expected = _reverse_bits_unpackbits(data, size)
+        timings = []
+        for kernel in KERNELS.values():
+            assert np.array_equal(kernel(data, size), expected)
+            timer = timeit.Timer(
+                lambda kernel=kernel, data=data, size=size: kernel(data, size)
+            )
+            timings.append(min(timer.repeat(repeat, number=1)))
+        print(f"{size:>4} " + " ".join(f"{t * 1e3:>10.2f}ms" for t in timings))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,59 @@
+"""Compare two benchmark results written by ``benchmarks/suite.py``.
+
+Run with ``python benchmarks/compare.py base.json head.json [--threshold 1.1]``.
+
+The ratio of the minimum time of each benchmark in both files is printed,
+slowest change first. The exit status is 1 if any benchmark is slower than
+`threshold` times its base time.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional
+
+
+def _load(path: str) -> Dict[str, dict]:
+    with open(path) as f:
+        report = json.load(f)
+    return {f"{r['name']}[{r['input']}][{r['rows']}]": r for r in report["results"]}
+
+
+def compare(base: Dict[str, dict], head: Dict[str, dict]) -> List[tuple]:
+    rows = []
+    for key in base.keys() & head.keys():
+        ratio = head[key]["min"] / base[key]["min"]
+        rows.append((key, base[key]["min"], head[key]["min"], ratio))
+    return sorted(rows, key=lambda row: row[-1], reverse=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.1,
+        help="the ratio above which a benchmark counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    base, head = _load(args.base), _load(args.head)
+    rows = compare(base, head)
+
+    print(f"{'benchmark':<64} {'base':>12} {'head':>12} {'ratio':>7}")
+    for key, before, after, ratio in rows:
+        flag = " !" if ratio > args.threshold else ""
+        print(
+            f"{key:<64} {before * 1e3:>10.3f}ms {after * 1e3:>10.3f}ms"
+            f" {ratio:>7.2f}{flag}"
+        )
+    for key in sorted(base.keys() ^ head.keys()):
+        print(f"{key:<64} only in {args.base if key in base else args.head}")
+
+    return int(any(ratio > args.threshold for *_, ratio in rows))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
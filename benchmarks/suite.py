@@ -0,0 +1,328 @@
+"""Benchmark the component, parameter, interp and EUC hot paths.
+
+Every benchmark is run against both a `numpy.ndarray` and a `pyarrow.Table`
+(or `pyarrow.Array`) input, for each requested number of rows, and the
+timings are written to a JSON file for comparison across commits with
+``benchmarks/compare.py``. Nothing is downloaded; the input is random data.
+
+Run with ``python benchmarks/suite.py [options]`` from a checkout, which
+benchmarks the package of that checkout whether or not it is installed, for
+example::
+
+    python benchmarks/suite.py --rows 1e3 1e6 --filter interp --output base.json
+
+Rows up to 1e8 are supported, given enough memory: a 1e8-row, 8-word frame
+array of 32-bit words takes 3.2 GB before any output is built.
+"""
+
+import argparse
+import json
+import platform
+import re
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numba
+import numpy as np
+import pyarrow as pa
+
+# Import `measurand` from this checkout, rather than any installed version
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from measurand.component import make_component
+from measurand.euc import (
+    ExpressionEUC,
+    FunctionEUC,
+    PiecewiseLinearEUC,
+    PolynomialEUC,
+    ScaleFactorEUC,
+)
+from measurand.interp import interp
+from measurand.measurand import make_measurand
+from measurand.parameter import make_parameter
+from measurand.utils import _reverse_bits_ndarray, _size_to_uint
+
+WORD_SIZES = (8, 10, 12, 16, 32)
+FRAME_LENGTH = 8
+DEFAULT_ROWS = (1_000, 100_000, 1_000_000)
+
+EUCS = {
+    "scale_factor": ScaleFactorEUC(data_bias=1, scale_factor=0.5, scaled_bias=-3),
+    "scale_factor_f4": ScaleFactorEUC(scale_factor=0.5, dtype="float32"),
+    "polynomial": PolynomialEUC(coefficients=(1.5, -0.25, 1e-3, 2e-6)),
+    "table": PiecewiseLinearEUC(x=(0, 100, 1000, 65535), y=(-10, 0, 50, 100)),
+    "expression": ExpressionEUC(expression="PV^2 * 1e-3 + sqrt(PV) - 4"),
+    "expression_jit": ExpressionEUC(expression="PV^2 * 1e-3 + sqrt(PV) - 4", jit=True),
+    "function": FunctionEUC(func=lambda x: x * 0.5 - 3),
+}
+
+MEASURANDS = (
+    "1-2;2c;EUC[0.5,0.1,-3]",
+    "1-4;ieee32;EUC[2]",
+    "1:2-7R+2+3:1-4;1c",
+    "1-8;ibm64",
+)
+
+
+class Benchmark(NamedTuple):
+    group: str
+    name: str
+    input: str
+    params: Dict[str, object]
+    func: Callable[[], object]
+
+    def key(self, rows: int) -> str:
+        return f"{self.name}[{self.input}][{rows}]"
+
+
+@lru_cache(maxsize=None)
+def _frames(word_size: int, rows: int) -> np.ndarray:
+    rng = np.random.default_rng(word_size)
+    return rng.integers(
+        0, 2**word_size, (rows, FRAME_LENGTH), dtype=_size_to_uint(word_size)
+    )
+
+
+@lru_cache(maxsize=None)
+def _table(word_size: int, rows: int) -> pa.Table:
+    frames = _frames(word_size, rows)
+    return pa.Table.from_arrays(
+        [pa.array(col) for col in frames.T],
+        names=[str(i) for i in range(FRAME_LENGTH)],
+    )
+
+
+def _inputs(word_size: int, rows: int) -> Iterator[Tuple[str, Callable[[], object]]]:
+    yield "ndarray", lambda: _frames(word_size, rows)
+    yield "table", lambda: _table(word_size, rows)
+
+
+def _component_benchmarks(rows: int) -> Iterator[Benchmark]:
+    for word_size in WORD_SIZES:
+        for reverse in (False, True):
+            spec = f"2:2-{word_size - 1}" + ("R" if reverse else "")
+            comp = make_component(spec, word_size=word_size)
+            # Tables are built through the zero-copy column views of a
+            # single-component `Parameter`, as `Measurand.build` does
+            param = make_parameter(spec, word_size=word_size)
+            for kind, data in _inputs(word_size, rows):
+                build = (
+                    comp._build_ndarray if kind == "ndarray" else param._build_paarray
+                )
+                yield Benchmark(
+                    "component",
+                    f"component[{spec},{word_size}]",
+                    kind,
+                    {"word_size": word_size, "reverse": reverse},
+                    lambda build=build, data=data: build(data()),
+                )
+
+
+def _parameter_benchmarks(rows: int) -> Iterator[Benchmark]:
+    for word_size in WORD_SIZES:
+        for spec in ("1-4", "1-4R", "1:1-3+3+5:2-6"):
+            param = make_parameter(spec, word_size=word_size)
+            if param.size > 64:
+                continue
+            for kind, data in _inputs(word_size, rows):
+                yield Benchmark(
+                    "parameter",
+                    f"parameter[{spec},{word_size}]",
+                    kind,
+                    {"word_size": word_size, "reverse": "R" in spec},
+                    lambda param=param, data=data: param.build(data()),
+                )
+
+
+@lru_cache(maxsize=None)
+def _raw(size: int, rows: int) -> np.ndarray:
+    rng = np.random.default_rng(size)
+    return rng.integers(0, 2**size, rows, dtype="u8").astype(_size_to_uint(size))
+
+
+@lru_cache(maxsize=None)
+def _raw_array(size: int, rows: int) -> pa.Array:
+    return pa.array(_raw(size, rows))
+
+
+def _raw_inputs(size: int, rows: int) -> Iterator[Tuple[str, Callable[[], object]]]:
+    yield "ndarray", lambda: _raw(size, rows)
+    yield "table", lambda: _raw_array(size, rows)
+
+
+def _interp_benchmarks(rows: int) -> Iterator[Benchmark]:
+    for spec, factory in interp.registry.items():
+        stage = factory()
+        size = stage.SIZE or 12
+        for kind, data in _raw_inputs(size, rows):
+            apply = stage.apply_ndarray if kind == "ndarray" else stage.apply_paarray
+            yield Benchmark(
+                "interp",
+                f"interp[{spec}]",
+                kind,
+                {"bits": size},
+                lambda apply=apply, data=data, size=size: apply(data(), size),
+            )
+
+
+def _euc_benchmarks(rows: int) -> Iterator[Benchmark]:
+    for name, stage in EUCS.items():
+        for kind, data in _raw_inputs(16, rows):
+            apply = stage.apply_ndarray if kind == "ndarray" else stage.apply_paarray
+            yield Benchmark(
+                "euc",
+                f"euc[{name}]",
+                kind,
+                {},
+                lambda apply=apply, data=data: apply(data(), 16),
+            )
+
+
+def _measurand_benchmarks(rows: int) -> Iterator[Benchmark]:
+    for spec in MEASURANDS:
+        for fused in (False, True):
+            m = make_measurand(spec, fused=fused)
+            for kind, data in _inputs(8, rows):
+                yield Benchmark(
+                    "measurand",
+                    f"measurand[{spec}]" + ("[fused]" if fused else ""),
+                    kind,
+                    {"fused": fused},
+                    lambda m=m, data=data: m.build(data()),
+                )
+
+
+def _reverse_bits_benchmarks(rows: int) -> Iterator[Benchmark]:
+    for size in (8, 10, 12, 16, 32):
+        yield Benchmark(
+            "utils",
+            f"_reverse_bits_ndarray[{size}]",
+            "ndarray",
+            {"bits": size},
+            lambda size=size: _reverse_bits_ndarray(_raw(size, rows), size),
+        )
+
+
+GROUPS = {
+    "component": _component_benchmarks,
+    "parameter": _parameter_benchmarks,
+    "interp": _interp_benchmarks,
+    "euc": _euc_benchmarks,
+    "measurand": _measurand_benchmarks,
+    "utils": _reverse_bits_benchmarks,
+}
+
+
+def _time(func: Callable[[], object], repeat: int, min_time: float) -> dict:
+    # The first call is untimed, so numba compilation and the construction of
+    # the cached input are not counted
+    func()
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    times = [t / number for t in timer.repeat(repeat, number)]
+    return {
+        "min": min(times),
+        "median": float(np.median(times)),
+        "mean": float(np.mean(times)),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _metadata() -> dict:
+    return {
+        "commit": _commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "numba": numba.__version__,
+        "pyarrow": pa.__version__,
+    }
+
+
+def run(
+    rows: List[int],
+    groups: List[str],
+    pattern: str = "",
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> dict:
+    results = []
+    regex = re.compile(pattern)
+    for n in rows:
+        for group in groups:
+            for bench in GROUPS[group](n):
+                key = bench.key(n)
+                if not regex.search(key):
+                    continue
+                with np.errstate(all="ignore"):
+                    timing = _time(bench.func, repeat, min_time)
+                results.append(
+                    {
+                        "group": bench.group,
+                        "name": bench.name,
+                        "input": bench.input,
+                        "rows": n,
+                        "params": bench.params,
+                        **timing,
+                    }
+                )
+                print(f"{key:<64} {timing['min'] * 1e3:>12.3f}ms", flush=True)
+        _frames.cache_clear()
+        _table.cache_clear()
+        _raw.cache_clear()
+        _raw_array.cache_clear()
+    return {"metadata": _metadata(), "results": results}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        nargs="+",
+        type=lambda v: int(float(v)),
+        default=list(DEFAULT_ROWS),
+        help="the numbers of rows to benchmark, such as 1e3 1e6",
+    )
+    parser.add_argument(
+        "--group", nargs="+", choices=list(GROUPS), default=list(GROUPS)
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run benchmarks whose name matches"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="the minimum time of each repeat, in seconds",
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    report = run(args.rows, args.group, args.filter, args.repeat, args.min_time)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,4 +1,17 @@
+from measurand.loader import load_measurand_set, save_measurand_set
 from measurand.measurand import Measurand, make_measurand
+from measurand.measurand_set import MeasurandSet, make_measurand_set
 from measurand.parameter import Parameter, make_parameter
+from measurand.reader import FrameFile
 
-__all__ = ["make_measurand", "Measurand", "make_parameter", "Parameter"]
+__all__ = [
+    "FrameFile",
+    "load_measurand_set",
+    "make_measurand",
+    "Measurand",
+    "make_measurand_set",
+    "MeasurandSet",
+    "make_parameter",
+    "Parameter",
+    "save_measurand_set",
+]
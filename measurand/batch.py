@@ -0,0 +1,107 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pyarrow as pa
+
+from measurand.measurand_set import MeasurandSet, make_measurand_set
+from measurand.reader import FrameFile
+
+DEFAULT_CHUNK_ROWS = 1 << 20
+
+# The `MeasurandSet` of a worker process, set once by `_init_worker`
+_builder: Optional[MeasurandSet] = None
+
+
+def _init_worker(builder: MeasurandSet) -> None:
+    global _builder
+    _builder = builder
+
+
+def _to_record_batch(results: Dict[str, np.ndarray]) -> pa.RecordBatch:
+    arrays = [
+        pa.array(v.astype(v.dtype.newbyteorder("="), copy=False))
+        for v in results.values()
+    ]
+    return pa.RecordBatch.from_arrays(arrays, names=list(results))
+
+
+def _build_file(file: FrameFile, output: str, chunk_rows: int) -> str:
+    # Each chunk of frames is written as a record batch as soon as it is
+    # built, so a worker holds at most one chunk of any file in memory
+    chunks = _builder.build_chunks(file.iter_chunks(chunk_rows))
+    first = next(chunks, None)
+    if first is None:
+        first = _builder.build(file.read(0, 0))
+
+    batch = _to_record_batch(first)
+    with pa.OSFile(output, "wb") as sink:
+        with pa.ipc.new_file(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+            for results in chunks:
+                writer.write_batch(_to_record_batch(results))
+    return output
+
+
+def build_files(
+    measurands: Union[MeasurandSet, Mapping[str, str], Sequence[str]],
+    files: Sequence[FrameFile],
+    outputs: Union[str, os.PathLike, Sequence[Union[str, os.PathLike]]],
+    workers: Optional[int] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> List[Path]:
+    """Build every measurand from each of many recordings on a process pool.
+
+    The measurands are parsed once and shipped to each worker process when
+    it starts, rather than with every file. Each worker builds whole files
+    and writes the results to an Arrow IPC file, so no output array is
+    pickled back to the caller. The outputs can be opened with
+    ``pyarrow.ipc.open_file(pyarrow.memory_map(path))`` without a copy.
+    Every measurand must have the same `Sampling` window, so that all of
+    the columns of an output have the same length.
+
+    Parameters
+    ----------
+    measurands : MeasurandSet, dict of str to str, or sequence of str
+        The measurands to build, or their specs as for `make_measurand_set`.
+    files : sequence of FrameFile
+        The recordings to build from.
+    outputs : str, os.PathLike, or sequence of them
+        A directory, in which the output of each file is named after it with
+        the ``.arrow`` suffix, or the path of each output.
+    workers : int, optional
+        The number of processes, by default the number of CPUs.
+    chunk_rows : int, default 1048576
+        The number of frames of each record batch of the outputs.
+
+    Returns
+    -------
+    list of pathlib.Path
+        The path of the output of each file.
+    """
+    if not isinstance(measurands, MeasurandSet):
+        measurands = make_measurand_set(measurands)
+    measurands._check_table_windows()
+
+    if isinstance(outputs, (str, os.PathLike)):
+        directory = Path(outputs)
+        directory.mkdir(parents=True, exist_ok=True)
+        outputs = [directory / f"{Path(file.path).stem}.arrow" for file in files]
+    outputs = [Path(output) for output in outputs]
+    if len(outputs) != len(files):
+        raise ValueError("outputs and files must have the same length")
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("every file needs a distinct output")
+
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(measurands,),
+    ) as pool:
+        futures = [
+            pool.submit(_build_file, file, str(output), chunk_rows)
+            for file, output in zip(files, outputs)
+        ]
+        return [Path(future.result()) for future in futures]
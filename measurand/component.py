@@ -9,8 +9,10 @@ from pydantic import BaseModel, Field
 
 from .utils import (
     _bit_range_to_mask_and_shift,
+    _extract_bits,
     _range_to_tuple,
     _reverse_bits_ndarray,
+    _reverse_bits_numba,
     _reverse_bits_paarray,
     _size_to_uint,
 )
@@ -84,6 +86,15 @@ class Component(BaseModel):
     def input_dtype(self) -> np.dtype:
         return _size_to_uint(self.word_size)
 
+    @cached_property
+    def bit_offset(self) -> int:
+        """The offset of the component's MSB from the start of a packed frame."""
+        return (self.word + 1) * self.word_size - self.shift - self.size
+
+    @property
+    def _key(self) -> tuple:
+        return (self.word, self.mask, self.shift, self.reverse, self.word_size)
+
     def __eq__(self, other: "Component") -> bool:
         return all(
             [
@@ -95,9 +106,13 @@ class Component(BaseModel):
             ]
         )
 
+    def __hash__(self) -> int:
+        return hash(self._key)
+
     def _build_ndarray(self, data: np.ndarray) -> np.ndarray:
-        tmp = data[:, self.word]
+        return self._extract_ndarray(data[:, self.word])
 
+    def _extract_ndarray(self, tmp: np.ndarray) -> np.ndarray:
         if self.mask:
             mask = np.array([self.mask], dtype=self.input_dtype)[0]
             tmp = np.bitwise_and(tmp, mask)
@@ -106,13 +121,41 @@ class Component(BaseModel):
             tmp = np.right_shift(tmp, np.uint8(self.shift))
 
         if self.reverse:
-            tmp = _reverse_bits_ndarray(tmp, self.size)
+            tmp = self._reverse_ndarray(tmp)
+
+        return tmp
+
+    def _reverse_ndarray(self, tmp: np.ndarray) -> np.ndarray:
+        # numba only handles native byte order
+        if tmp.dtype.isnative:
+            return _reverse_bits_numba(tmp, self.size)
+        return _reverse_bits_ndarray(tmp, self.size)
+
+    def _build_bitstream(self, data: np.ndarray, frame_bits: int) -> np.ndarray:
+        # `data` holds either one byte-aligned frame per row, or a single row
+        # with every `frame_bits`-bit frame packed back to back
+        if self.bit_offset + self.size > (frame_bits or data.shape[1] * 8):
+            raise IndexError(
+                f"{self.size}-bit component at bit {self.bit_offset} is past the "
+                "end of the frame"
+            )
+
+        if frame_bits:
+            frames = data.shape[1] * 8 // frame_bits
+            offsets = np.arange(frames, dtype=np.int64) * frame_bits + self.bit_offset
+            tmp = _extract_bits(data, offsets, self.size)[0]
+        else:
+            tmp = _extract_bits(data, [self.bit_offset], self.size)[:, 0]
+
+        if self.reverse:
+            tmp = self._reverse_ndarray(tmp)
 
         return tmp
 
-    def _build_paarray(self, data: pa.Array) -> pa.Array:
-        tmp = data[self.word]
+    def _build_paarray(self, data: pa.Table) -> pa.Array:
+        return self._extract_paarray(data[self.word])
 
+    def _extract_paarray(self, tmp: pa.Array) -> pa.Array:
         if self.mask:
             mask = np.array([self.mask], dtype=self.input_dtype)[0]
             tmp = pac.bit_wise_and(tmp, mask)
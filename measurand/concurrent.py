@@ -0,0 +1,129 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pyarrow as pa
+
+DEFAULT_CHUNK_ROWS = 1 << 18
+
+
+def _bounds(rows: int, chunk_rows: int, multiple: int) -> List[Tuple[int, int]]:
+    # Chunks are aligned to `multiple` rows, so no window of a `Sampling`
+    # stage is split between two chunks
+    chunk_rows = max(chunk_rows - chunk_rows % multiple, multiple)
+    return [
+        (start, min(start + chunk_rows, rows)) for start in range(0, rows, chunk_rows)
+    ]
+
+
+def _windows(builder) -> Dict[Optional[str], int]:
+    # The window of each output of `builder`, keyed by measurand name, or
+    # None for a single `Measurand`
+    if hasattr(builder, "measurands"):
+        return {name: m._window for name, m in builder.measurands.items()}
+    return {None: builder._window}
+
+
+def _concatenate_paarrays(results: list) -> Union[pa.ChunkedArray, pa.Table]:
+    if isinstance(results[0], pa.Table):
+        return pa.concat_tables(results)
+    chunks = []
+    for result in results:
+        if isinstance(result, pa.ChunkedArray):
+            chunks.extend(result.chunks)
+        else:
+            chunks.append(result)
+    return pa.chunked_array(chunks, type=results[0].type)
+
+
+def _allocate(rows: int, like: np.ndarray) -> np.ndarray:
+    # An output of `rows` values of the dtype of `like`, masked if it is
+    if np.ma.isMA(like):
+        return np.ma.MaskedArray(
+            np.empty(rows, dtype=like.dtype), mask=np.zeros(rows, dtype=bool)
+        )
+    return np.empty(rows, dtype=like.dtype)
+
+
+def build_threaded(
+    builder,
+    data: Union[np.ndarray, pa.Table],
+    workers: Optional[int] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+):
+    """Build a `Measurand` or `MeasurandSet` on a pool of threads.
+
+    The rows of `data` are split into chunks of `chunk_rows` frames, which
+    are built concurrently. Fused kernels and most NumPy operations release
+    the GIL, so the chunks are built in parallel. For `numpy.ndarray` input,
+    each chunk is written into a slice of a single preallocated output
+    array, which a fused kernel writes to directly. The output is identical
+    to ``builder.build(data)``.
+
+    Parameters
+    ----------
+    builder : Measurand or MeasurandSet
+        The measurand(s) to build.
+    data : numpy.ndarray or pyarrow.Table
+        The frames to build from.
+    workers : int, optional
+        The number of threads, by default the number of CPUs.
+    chunk_rows : int, default 262144
+        The number of frames built by each task. It is rounded down to a
+        multiple of the `Sampling` window of the builder.
+
+    Returns
+    -------
+    The output of ``builder.build(data)``.
+    """
+    workers = workers or os.cpu_count() or 1
+    bounds = _bounds(len(data), chunk_rows, builder._window)
+    if workers == 1 or len(bounds) <= 1:
+        return builder.build(data)
+
+    if isinstance(data, pa.Table):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(
+                pool.map(lambda b: builder.build(data.slice(b[0], b[1] - b[0])), bounds)
+            )
+        return _concatenate_paarrays(results)
+
+    data = np.atleast_2d(data)
+    windows = _windows(builder)
+
+    # The first chunk is built up front, which gives the dtype of every
+    # output and compiles any numba kernels before the threads start
+    (start, stop), *rest = bounds
+    first = builder.build(data[start:stop])
+    first = first if isinstance(first, dict) else {None: first}
+    outputs = {
+        name: _allocate(-(-len(data) // windows[name]), result)
+        for name, result in first.items()
+    }
+
+    def write(results: dict, start: int) -> None:
+        for name, result in results.items():
+            offset = start // windows[name]
+            outputs[name][offset : offset + len(result)] = result
+
+    def work(start: int, stop: int) -> None:
+        if direct:
+            builder.kernel(data[start:stop], out=outputs[None][start:stop])
+            return
+        result = builder.build(data[start:stop])
+        write(result if isinstance(result, dict) else {None: result}, start)
+
+    # A fused kernel without sampling writes straight into the output, unless
+    # the output needs a mask
+    direct = (
+        getattr(builder, "fused", False)
+        and builder.sampling is None
+        and not np.ma.isMA(data)
+    )
+    write(first, start)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(work, *b) for b in rest]:
+            future.result()
+
+    return outputs[None] if None in outputs else outputs
@@ -1,35 +1,47 @@
 import re
 from functools import cached_property
-from typing import Annotated, Callable, Optional, Union
+from typing import Annotated, Callable, Literal, Optional, Tuple, Union
 
 import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
-from pydantic import BeforeValidator
+from numba import njit, vectorize
+from numba.core.errors import NumbaError
+from pydantic import BeforeValidator, Field, field_validator, model_validator
 
+from measurand.expression import compile_expression, evaluate_constant, parse
 from measurand.generic import MeasurandModifier
+from measurand.utils import _arrow_to_numpy_dtype, _map_paarray
 
 RE_SCALEFACTOR = re.compile(
     r"^(?:EUC)?\[?(?:(?P<data_bias>\S+?),)?(?P<scale_factor>\S+?)(?:,(?P<scaled_bias>\S+?))?\]?$",
     re.IGNORECASE,
 )
-RE_FLOAT = re.compile(r"[\d\.\+\-\*\/]+")
+RE_POLYNOMIAL = re.compile(r"^POLY\[(?P<coefficients>[^\]]+)\]$", re.IGNORECASE)
+RE_TABLE = re.compile(r"^TABLE\[(?P<points>[^\]]+)\]$", re.IGNORECASE)
 
 
 def _validate_float(spec: str) -> float:
     try:
         return np.float32(float(spec))
     except ValueError:
-        # Power: Replace ^ (bitwise and) with ** (raise to power)
-        spec = spec.replace("^", "**")
-        if RE_FLOAT.match(spec):
-            return np.float32(eval(spec))
-    raise ValueError
+        return np.float32(evaluate_constant(spec))
 
 
 Float = Annotated[float, BeforeValidator(_validate_float)]
 
 
+def _validate_float64(spec: str) -> float:
+    try:
+        return float(spec)
+    except ValueError:
+        return evaluate_constant(spec)
+
+
+# Calibration coefficients and breakpoints keep their full precision
+Float64 = Annotated[float, BeforeValidator(_validate_float64)]
+
+
 class EUC(MeasurandModifier):
     pass
 
@@ -64,41 +76,54 @@ class ScaleFactorEUC(EUC):
     data_bias : float or None
     scale_factor : float or None
     scaled_bias: float or None
+    dtype : {"float32", "float64"} or None
+        The floating type of the result, computed in native byte order.
+        By default, floating input keeps its precision and integers are
+        converted to float64.
     """
 
     data_bias: Optional[Float] = None
     scale_factor: Optional[Float] = None
     scaled_bias: Optional[Float] = None
+    dtype: Optional[Literal["float32", "float64"]] = None
+
+    @property
+    def _terms(self) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        return (self.data_bias, self.scale_factor, self.scaled_bias)
+
+    def _output_dtype(self, dtype: np.dtype) -> np.dtype:
+        if self.dtype is not None:
+            return np.dtype(self.dtype)
+        if np.issubdtype(dtype, np.floating):
+            return dtype.newbyteorder("=")
+        return np.dtype(np.float64)
 
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
-        dtype = np.dtype(">f8")
+        if all(v is None for v in self._terms):
+            return data
 
-        # If the data is not already floating, and the EUC is not a No-Op:
-        # Convert the data to float
-        if not np.issubdtype(data.dtype, np.floating) and any(
-            v is not None for v in (self.data_bias, self.scale_factor, self.scaled_bias)
-        ):
-            data = data.astype(dtype)
+        # A single native-endian output array, never the caller's (possibly
+        # shared) input, is allocated and every term is applied to it in place
+        out = data.astype(self._output_dtype(data.dtype))
 
         if self.data_bias is not None:
-            data += self.data_bias
+            np.add(out, self.data_bias, out=out)
 
         if self.scale_factor is not None:
-            data = data * self.scale_factor
+            np.multiply(out, self.scale_factor, out=out)
 
         if self.scaled_bias is not None:
-            data += self.scaled_bias
+            np.add(out, self.scaled_bias, out=out)
 
-        return data
+        return out
 
     def apply_paarray(self, data: pa.Array, bits: int) -> pa.Array:
-        dtype = pa.from_numpy_dtype(np.dtype(">f8"))
+        if all(v is None for v in self._terms):
+            return data
 
-        # If the data is not already floating, and the EUC is not a No-Op:
-        # Convert the data to float
-        if not pa.types.is_floating(data.type) and any(
-            v is not None for v in (self.data_bias, self.scale_factor, self.scaled_bias)
-        ):
+        dtype = self._output_dtype(_arrow_to_numpy_dtype(data.type))
+        dtype = pa.from_numpy_dtype(dtype)
+        if data.type != dtype:
             data = data.cast(dtype)
 
         if self.data_bias is not None:
@@ -113,25 +138,199 @@ class ScaleFactorEUC(EUC):
         return data
 
 
+@njit(nogil=True)
+def _horner(data: np.ndarray, coefficients: np.ndarray, out: np.ndarray) -> None:
+    for i in range(data.shape[0]):
+        value = coefficients[-1]
+        for j in range(coefficients.shape[0] - 2, -1, -1):
+            value = value * data[i] + coefficients[j]
+        out[i] = value
+
+
+class PolynomialEUC(EUC):
+    """A polynomial Engineering Unit Conversion.
+
+    The polynomial is evaluated with Horner's method in a single pass:
+
+        c[0] + c[1] * PV + c[2] * PV^2 + ... + c[n] * PV^n
+
+    Attributes
+    ----------
+    coefficients : tuple of float
+        The coefficients, in order of increasing power of PV.
+    """
+
+    coefficients: Tuple[Float64, ...]
+
+    @model_validator(mode="after")
+    def _validate_coefficients(self) -> "PolynomialEUC":
+        if not self.coefficients:
+            raise ValueError("a polynomial needs at least one coefficient")
+        return self
+
+    def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
+        data = data.astype(np.float64)
+        out = np.empty_like(data)
+        _horner(data, np.array(self.coefficients, dtype=np.float64), out)
+        return out
+
+    def apply_paarray(self, data: pa.Array, bits: int) -> pa.Array:
+        return _map_paarray(data, lambda x: self.apply_ndarray(x, bits))
+
+
+class PiecewiseLinearEUC(EUC):
+    """A table-lookup Engineering Unit Conversion.
+
+    Each value of the `Parameter` is linearly interpolated between the two
+    surrounding breakpoints of the table. Values outside of the table are
+    extrapolated from its first or last segment.
+
+    Attributes
+    ----------
+    x : tuple of float
+        The raw values of the breakpoints, in increasing order.
+    y : tuple of float
+        The engineering values of the breakpoints.
+    """
+
+    x: Tuple[Float64, ...]
+    y: Tuple[Float64, ...]
+
+    @model_validator(mode="after")
+    def _validate_table(self) -> "PiecewiseLinearEUC":
+        if len(self.x) != len(self.y):
+            raise ValueError("x and y must have the same length")
+        if len(self.x) < 2:
+            raise ValueError("a table needs at least two breakpoints")
+        if any(a >= b for a, b in zip(self.x, self.x[1:])):
+            raise ValueError("x must be strictly increasing")
+        return self
+
+    @cached_property
+    def _segments(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        x = np.array(self.x, dtype=np.float64)
+        y = np.array(self.y, dtype=np.float64)
+        return x, y, np.diff(y) / np.diff(x)
+
+    def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
+        x, y, slopes = self._segments
+        data = data.astype(np.float64)
+        index = np.searchsorted(x, data, side="right") - 1
+        np.clip(index, 0, len(slopes) - 1, out=index)
+        out = data - x[index]
+        out *= slopes[index]
+        out += y[index]
+        return out
+
+    def apply_paarray(self, data: pa.Array, bits: int) -> pa.Array:
+        return _map_paarray(data, lambda x: self.apply_ndarray(x, bits))
+
+
 class FunctionEUC(EUC):
+    """An Engineering Unit Conversion defined by an arbitrary function.
+
+    `func` is applied to each value of the `Parameter` as a float. It is
+    compiled into a true ufunc with numba when possible, and NumPy ufuncs
+    are used as they are; other functions fall back to `numpy.vectorize`.
+
+    Attributes
+    ----------
+    func : callable
+        A function of one float, returning a float.
+    """
+
     func: Callable[[Union[int, float]], float]
 
     @cached_property
     def vectorized_func(self) -> Callable:
-        return np.vectorize(self.func)
+        if isinstance(self.func, np.ufunc):
+            return self.func
+
+        func = self.func
+        # Builtins numba understands, such as `math.sqrt`, can only be
+        # compiled when called from a Python function
+        for candidate in (func, lambda x: func(x)):
+            try:
+                return vectorize(["f8(f8)"], nopython=True)(candidate)
+            except (NumbaError, TypeError, ValueError):
+                pass
+        return np.vectorize(func, otypes=[np.float64])
 
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
         data = data.astype(np.float64)
         return self.vectorized_func(data)
 
+    def apply_paarray(self, data: pa.Array, bits: int) -> pa.Array:
+        return _map_paarray(data, lambda x: self.apply_ndarray(x, bits))
+
+
+class ExpressionEUC(EUC):
+    """An Engineering Unit Conversion defined by an expression of PV.
+
+    The expression is parsed once and validated against a whitelist of
+    arithmetic operators, numbers, the constants ``pi`` and ``e`` and common
+    math functions, such as ``sqrt`` and ``log10``; anything else is
+    rejected. It is evaluated with NumPy, or with a compiled numba ufunc
+    when `jit` is set, which avoids the temporary array of each operation.
+
+    Attributes
+    ----------
+    expression : str
+        The expression, for example ``"PV^2 * 1e-3 + sqrt(PV) - 4"``.
+    jit : bool, default False
+        Compile the expression with numba.
+    """
+
+    expression: str = Field(frozen=True)
+    jit: bool = Field(default=False, frozen=True)
+
+    @field_validator("expression")
+    @classmethod
+    def _validate_expression(cls, v: str) -> str:
+        parse(v)
+        return v
+
+    @cached_property
+    def func(self) -> Callable:
+        func = compile_expression(self.expression)
+        if self.jit:
+            return vectorize(["f8(f8)"], nopython=True)(func)
+        return func
+
+    def __getstate__(self) -> dict:
+        # The compiled `func` cannot be pickled; it is rebuilt on first use
+        state = super().__getstate__()
+        state["__dict__"] = {k: v for k, v in state["__dict__"].items() if k != "func"}
+        return state
+
+    def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
+        data = data.astype(np.float64)
+        with np.errstate(all="ignore"):
+            result = self.func(data)
+        if np.ndim(result) == 0:
+            # The expression does not depend on PV
+            result = np.full(data.shape, result, dtype=np.float64)
+        return result
+
+    def apply_paarray(self, data: pa.Array, bits: int) -> pa.Array:
+        return _map_paarray(data, lambda x: self.apply_ndarray(x, bits))
+
 
 def make_euc(spec: str) -> EUC:
+    if "PV" in spec.upper():
+        return ExpressionEUC(expression=spec)
+    if match := RE_POLYNOMIAL.match(spec):
+        return PolynomialEUC(coefficients=match.group("coefficients").split(","))
+    if match := RE_TABLE.match(spec):
+        points = [point.split(":") for point in match.group("points").split(",")]
+        if any(len(point) != 2 for point in points):
+            raise ValueError(f"EUC spec {spec!r} not valid")
+        x, y = zip(*points)
+        return PiecewiseLinearEUC(x=x, y=y)
     if match := RE_SCALEFACTOR.match(spec):
         return ScaleFactorEUC(
             data_bias=match.group("data_bias"),
             scale_factor=match.group("scale_factor"),
             scaled_bias=match.group("scaled_bias"),
         )
-    elif "PV" in spec.upper():
-        raise NotImplementedError
     raise ValueError(f"EUC spec {spec!r} not valid")
@@ -0,0 +1,159 @@
+import ast
+from typing import Callable, Dict, Sequence
+
+import numpy as np
+
+VARIABLE = "PV"
+
+FUNCTIONS: Dict[str, np.ufunc] = {
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "exp": np.exp,
+    "log": np.log,
+    "log2": np.log2,
+    "log10": np.log10,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "asin": np.arcsin,
+    "acos": np.arccos,
+    "atan": np.arctan,
+    "arcsin": np.arcsin,
+    "arccos": np.arccos,
+    "arctan": np.arctan,
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+    "tanh": np.tanh,
+    "floor": np.floor,
+    "ceil": np.ceil,
+}
+
+CONSTANTS: Dict[str, float] = {"pi": np.pi, "e": np.e}
+
+_OPERATORS = (
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+
+class _Validator(ast.NodeTransformer):
+    # Reject every node that is not arithmetic on numbers, PV, the whitelisted
+    # constants and calls of the whitelisted functions, so evaluating the
+    # expression can never reach anything else
+
+    def __init__(self, variables: bool) -> None:
+        self.variables = variables
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        allowed = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Load) + _OPERATORS
+        if not isinstance(node, allowed):
+            raise ValueError(f"{type(node).__name__} not allowed in expression")
+        return super().generic_visit(node)
+
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"constant {node.value!r} not allowed in expression")
+        # Integers are evaluated as floats, so no expression such as 9^9^9
+        # can turn into an arbitrarily expensive integer computation
+        try:
+            value = float(node.value)
+        except OverflowError as e:
+            raise ValueError(f"constant {node.value!r} out of range") from e
+        return ast.copy_location(ast.Constant(value=value), node)
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if self.variables and node.id.upper() == VARIABLE:
+            return ast.copy_location(ast.Name(id=VARIABLE, ctx=ast.Load()), node)
+        if node.id in CONSTANTS:
+            return ast.copy_location(ast.Constant(value=CONSTANTS[node.id]), node)
+        raise ValueError(f"name {node.id!r} not allowed in expression")
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        return _fold(self.generic_visit(node), (node.left, node.right))
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        return _fold(self.generic_visit(node), (node.operand,))
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            raise ValueError("only whitelisted functions may be called")
+        if len(node.args) != 1 or node.keywords:
+            raise ValueError(f"{node.func.id}() takes exactly one argument")
+        node.args = [self.visit(node.args[0])]
+        return _fold(node, node.args)
+
+
+def _fold(node: ast.AST, operands: Sequence[ast.AST]) -> ast.AST:
+    # Constant subexpressions are evaluated once, here, as Python floats would
+    # be when the expression runs. Those that overflow or divide by zero are
+    # rejected now rather than failing every build.
+    if not all(isinstance(operand, ast.Constant) for operand in operands):
+        return node
+    code = compile(ast.Expression(body=node), "<expression>", "eval")
+    try:
+        with np.errstate(all="ignore"):
+            value = eval(code, _namespace())
+    except ArithmeticError as e:
+        raise ValueError(f"constant subexpression not valid: {e}") from e
+    if not isinstance(value, (float, np.floating)):
+        raise ValueError(f"constant subexpression is not a real number: {value!r}")
+    return ast.copy_location(ast.Constant(value=float(value)), node)
+
+
+def parse(source: str, variables: bool = True) -> ast.Expression:
+    """Parse and validate an expression.
+
+    ``^`` is accepted as the power operator.
+
+    Raises
+    ------
+    ValueError
+        If the expression is not valid or uses anything but arithmetic,
+        numbers, ``PV`` (when `variables` is set), the names in `CONSTANTS`
+        and the functions in `FUNCTIONS`, or if a constant subexpression,
+        which is folded into a number, overflows or divides by zero.
+    """
+    try:
+        tree = ast.parse(source.strip().replace("^", "**"), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"expression {source!r} not valid") from e
+    return ast.fix_missing_locations(_Validator(variables).visit(tree))
+
+
+def _namespace() -> dict:
+    return {"__builtins__": {}, **FUNCTIONS, **CONSTANTS}
+
+
+def compile_expression(source: str) -> Callable:
+    """Compile an expression of ``PV`` into a function of one argument.
+
+    The function works on scalars and, element-wise, on `numpy.ndarray`,
+    and can be compiled with `numba.vectorize`.
+    """
+    tree = parse(source)
+    args = ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg=VARIABLE)],
+        kwonlyargs=[],
+        kw_defaults=[],
+        defaults=[],
+    )
+    func = ast.Expression(body=ast.Lambda(args=args, body=tree.body))
+    code = compile(ast.fix_missing_locations(func), "<expression>", "eval")
+    return eval(code, _namespace())
+
+
+def evaluate_constant(source: str) -> float:
+    """Evaluate an expression of numbers and constants, such as ``2^-3``."""
+    code = compile(parse(source, variables=False), "<expression>", "eval")
+    try:
+        return float(eval(code, _namespace()))
+    except ArithmeticError as e:
+        raise ValueError(f"expression {source!r} not valid: {e}") from e
@@ -0,0 +1,319 @@
+import hashlib
+import importlib.util
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numba import njit
+from pydantic import BaseModel, ConfigDict
+
+from measurand.euc import PolynomialEUC, ScaleFactorEUC
+from measurand.interp import interp as interp_factory
+from measurand.types import jfunc
+from measurand.utils import _reverse_bits_scalar
+
+
+@njit(nogil=True)
+def _byteswap(value: np.uint64, size: int) -> np.uint64:
+    result = np.uint64(0)
+    for _ in range(size):
+        result = (result << np.uint64(8)) | (value & np.uint64(0xFF))
+        value = value >> np.uint64(8)
+    return result
+
+
+# The IEEE interps view the native parameter as a big-endian float, which on a
+# little-endian host is the same as viewing the byte-swapped parameter
+_IEEE = "_byteswap(raw, {nbytes})" if sys.byteorder == "little" else "raw"
+
+# Source of the scalar expression computing each interp from `raw`, a uint64,
+# keyed by the spec the interp is registered under
+_INTERP_SOURCE: Dict[str, str] = {
+    "u": "np.{uint}(raw)",
+    "1c": "jfunc.onescomp(np.{uint}(raw), np.uint8({bits}))",
+    "2c": "jfunc.twoscomp(np.{uint}(raw), np.uint8({bits}))",
+    "ieee32": f"np.uint32({_IEEE.format(nbytes=4)}).view(np.float32)",
+    "ieee64": f"np.uint64({_IEEE.format(nbytes=8)}).view(np.float64)",
+    "1750a32": "jfunc.milstd1750a32(np.uint32(raw))",
+    "1750a48": "jfunc.milstd1750a48(raw)",
+    "ti32": "jfunc.ti32(np.uint32(raw))",
+    "ti40": "jfunc.ti40(raw)",
+    "ibm32": "jfunc.ibm32(np.uint32(raw))",
+    "ibm64": "jfunc.ibm64(raw)",
+    "dec32": "jfunc.dec32(np.uint32(raw))",
+    "dec64": "jfunc.dec64(raw)",
+    "dec64g": "jfunc.dec64g(raw)",
+    "bcd": "jfunc.bcd(raw)",
+}
+
+_NAMESPACE = {
+    "np": np,
+    "jfunc": jfunc,
+    "_reverse_bits_scalar": _reverse_bits_scalar,
+    "_byteswap": _byteswap,
+}
+
+# Imports of a generated kernel module written to an on-disk cache directory
+_MODULE_HEADER = """\
+import numpy as np
+
+from measurand.fused import _byteswap
+from measurand.types import jfunc
+from measurand.utils import _reverse_bits_scalar
+
+
+"""
+
+
+class FusedKernel(BaseModel):
+    """A compiled kernel building a `Measurand` in a single loop.
+
+    The kernel extracts and concatenates the components of the `Parameter`,
+    then applies the interp and EUC to each value in turn, writing straight
+    into the output array without any intermediate arrays. It is compiled
+    both for a 2-D frame matrix and for a 1-D array of each word, so the
+    buffers of an Arrow table are read in place.
+
+    Attributes
+    ----------
+    source : str
+        The generated Python source of the kernel.
+    output_dtype : numpy.dtype
+        The native-endian dtype of the kernel output.
+    words : tuple of int
+        The words read by the kernel.
+    func : callable
+        The compiled kernel, called as ``func(data, out)``.
+    columns_func : callable
+        The compiled kernel, called as ``columns_func(*columns, out)`` with a
+        1-D array of each of `words`.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    source: str
+    output_dtype: np.dtype
+    words: Tuple[int, ...]
+    func: Callable
+    columns_func: Callable
+
+    def __call__(self, data: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        tmp = np.atleast_2d(data)
+        if not tmp.dtype.isnative:
+            tmp = tmp.astype(tmp.dtype.newbyteorder("="))
+        if out is None:
+            out = np.empty(tmp.shape[0], dtype=self.output_dtype)
+        self.func(tmp, out)
+        return out
+
+    def apply_columns(
+        self, columns: Sequence[np.ndarray], out: np.ndarray = None
+    ) -> np.ndarray:
+        """Run the kernel on a 1-D array of each of `words`."""
+        # numba only handles native byte order
+        columns = [
+            c if c.dtype.isnative else c.astype(c.dtype.newbyteorder("="))
+            for c in columns
+        ]
+        if out is None:
+            out = np.empty(len(columns[0]), dtype=self.output_dtype)
+        self.columns_func(*columns, out)
+        return out
+
+
+def _output_dtype(measurand) -> np.dtype:
+    # Build a single frame with the staged pipeline, so the kernel produces
+    # exactly the same dtype as `Measurand._build_ndarray`
+    param = measurand.parameter
+    words = max(comp.word for comp in param.components) + 1
+    sample = np.zeros((1, words), dtype=param.components[0].input_dtype)
+    staged = measurand.model_copy(update={"fused": False, "sampling": None})
+    return staged._build_ndarray(sample).dtype.newbyteorder("=")
+
+
+def _fused_source(measurand, output_dtype: np.dtype) -> str:
+    # `kernel` reads the words of a 2-D frame matrix, which lets LLVM load
+    # adjacent words together, and `kernel_columns` reads a 1-D array of each
+    # word, such as the buffers of an Arrow table
+    args = ", ".join(f"w{word}" for word in measurand.parameter.words)
+    lines: List[str] = [
+        "def kernel(data, out):",
+        "    for i in range(data.shape[0]):",
+        *_fused_body(measurand, output_dtype, "data[i, {}]".format),
+        "",
+        "",
+        f"def kernel_columns({args}, out):",
+        "    for i in range(out.shape[0]):",
+        *_fused_body(measurand, output_dtype, "w{}[i]".format),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _fused_body(
+    measurand, output_dtype: np.dtype, read: Callable[[int], str]
+) -> List[str]:
+    # The body of the loop of a kernel, where `read` gives the expression
+    # reading a word of the current frame
+    param = measurand.parameter
+    lines: List[str] = ["        raw = np.uint64(0)"]
+
+    offset = 0
+    for comp in reversed(param.components):
+        lines.append(f"        value = np.uint64({read(comp.word)})")
+        if comp.mask:
+            lines.append(f"        value = value & np.uint64({comp.mask})")
+        if comp.shift:
+            lines.append(f"        value = value >> np.uint64({comp.shift})")
+        if comp.reverse:
+            lines.append(f"        value = _reverse_bits_scalar(value, {comp.size})")
+        lines.append(f"        raw = raw | (value << np.uint64({offset}))")
+        offset += comp.size
+
+    spec = "u"
+    if measurand.interp is not None:
+        specs = {cls: key for key, cls in interp_factory.registry.items()}
+        spec = specs.get(type(measurand.interp))
+    if spec not in _INTERP_SOURCE:
+        name = type(measurand.interp).__name__
+        raise NotImplementedError(f"{name} cannot be fused")
+    expr = _INTERP_SOURCE[spec].format(uint=param.output_dtype, bits=param.size)
+    lines.append(f"        value = {expr}")
+
+    euc = measurand.euc
+    if isinstance(euc, PolynomialEUC):
+        dtype = f"np.{output_dtype.name}"
+        lines.append(f"        value = {dtype}(value)")
+        *rest, last = euc.coefficients
+        lines.append(f"        result = {dtype}({float(last)!r})")
+        for c in reversed(rest):
+            lines.append(f"        result = result * value + {dtype}({float(c)!r})")
+        lines.append("        value = result")
+    elif euc is not None:
+        if not isinstance(euc, ScaleFactorEUC):
+            raise NotImplementedError(f"{type(euc).__name__} cannot be fused")
+        terms = (euc.data_bias, euc.scale_factor, euc.scaled_bias)
+        if any(v is not None for v in terms):
+            dtype = f"np.{output_dtype.name}"
+            lines.append(f"        value = {dtype}(value)")
+            for op, v in zip("+*+", terms):
+                if v is not None:
+                    lines.append(f"        value = value {op} {dtype}({float(v)!r})")
+
+    lines.append("        out[i] = value")
+    return lines
+
+
+def _load_source(source: str, cache_dir: str) -> Dict[str, Any]:
+    # Each kernel is written to its own module, named after its source, so that
+    # numba can cache the compiled machine code next to it between processes
+    name = "fused_" + hashlib.sha1(source.encode()).hexdigest()
+    path = os.path.join(cache_dir, name + ".py")
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(_MODULE_HEADER + source)
+        os.replace(tmp, path)
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return vars(module)
+
+
+def compile_measurand(measurand, cache_dir: Optional[str] = None) -> FusedKernel:
+    """Compile a `Measurand` into a `FusedKernel`.
+
+    Parameters
+    ----------
+    measurand : Measurand
+        The measurand to compile.
+    cache_dir : str, optional
+        A directory in which the generated kernel and its compiled machine
+        code are cached between processes.
+
+    Raises
+    ------
+    NotImplementedError
+        If the interp or EUC of the measurand has no fused implementation.
+    """
+    output_dtype = _output_dtype(measurand)
+    source = _fused_source(measurand, output_dtype)
+
+    # Each kernel is only compiled when it is first called
+    if cache_dir is not None:
+        namespace = _load_source(source, cache_dir)
+        jit = njit(nogil=True, cache=True)
+    else:
+        namespace = dict(_NAMESPACE)
+        exec(compile(source, "<fused>", "exec"), namespace)
+        jit = njit(nogil=True)
+    return FusedKernel(
+        source=source,
+        output_dtype=output_dtype,
+        words=measurand.parameter.words,
+        func=jit(namespace["kernel"]),
+        columns_func=jit(namespace["kernel_columns"]),
+    )
+
+
+class KernelCache:
+    """A least-recently-used cache of `FusedKernel` objects.
+
+    Kernels are keyed on the structure of the `Parameter`, interp and EUC of
+    a `Measurand` rather than its spec, so equivalent specs such as
+    ``"1-2;2c"`` and ``"1+2;2c"`` share a single kernel.
+
+    Parameters
+    ----------
+    maxsize : int, default 1024
+        The maximum number of kernels held in memory.
+    cache_dir : str, optional
+        A directory in which kernels are also cached on disk, so they are
+        not recompiled by later processes.
+
+    Attributes
+    ----------
+    hits : int
+        The number of lookups served from memory.
+    misses : int
+        The number of lookups which compiled or loaded a kernel.
+    """
+
+    def __init__(self, maxsize: int = 1024, cache_dir: Optional[str] = None) -> None:
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._kernels: "OrderedDict[Hashable, FusedKernel]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._kernels)
+
+    def get(self, measurand) -> FusedKernel:
+        key = measurand._key
+        with self._lock:
+            if key in self._kernels:
+                self.hits += 1
+                self._kernels.move_to_end(key)
+                return self._kernels[key]
+
+            self.misses += 1
+            kernel = compile_measurand(measurand, cache_dir=self.cache_dir)
+            self._kernels[key] = kernel
+            while len(self._kernels) > self.maxsize:
+                self._kernels.popitem(last=False)
+            return kernel
+
+    def clear(self) -> None:
+        with self._lock:
+            self._kernels.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+kernel_cache = KernelCache(cache_dir=os.environ.get("MEASURAND_CACHE_DIR"))
@@ -1,4 +1,3 @@
-import functools
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 
@@ -22,13 +21,10 @@ class ObjectFactory:
     @classmethod
     def register(cls, v: str) -> callable:
         def decorator(fn):
+            # `fn` itself is returned so that registered classes can be
+            # pickled, e.g. to ship models to worker processes
             cls._registry[v.lower()] = fn
-
-            @functools.wraps(fn)
-            def wrapper(*args, **kwargs):
-                return fn(*args, **kwargs)
-
-            return wrapper
+            return fn
 
         return decorator
 
@@ -47,6 +43,12 @@ class ObjectFactory:
 class MeasurandModifier(BaseModel, ABC):
     model_config: ConfigDict = ConfigDict(arbitrary_types_allowed=True)
 
+    @property
+    def _key(self) -> tuple:
+        return (self.__class__,) + tuple(
+            getattr(self, name) for name in self.__class__.model_fields
+        )
+
     @abstractmethod
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray: ...
 
@@ -1,18 +1,62 @@
-from typing import ClassVar, Optional
+import os
+from typing import ClassVar, Literal, Optional
 
 import numpy as np
 import pyarrow as pa
-import typeconvert.ufunc as tcu
 
 from measurand.generic import MeasurandModifier, ObjectFactory
+from measurand.types import ufunc, ufunc_parallel
+from measurand.utils import _map_paarray
+
+Target = Literal["cpu", "parallel"]
+
+_target: Target = "cpu"
+
+
+def set_target(target: Target) -> None:
+    """Set the numba target of every interp without a `target` of its own.
+
+    The "parallel" target splits each conversion across all of the cores
+    numba is allowed to use. The initial target is read from the
+    ``MEASURAND_TARGET`` environment variable, and defaults to "cpu".
+    """
+    global _target
+    if target not in ("cpu", "parallel"):
+        raise ValueError(f"target {target!r} not valid")
+    _target = target
+
+
+set_target(os.environ.get("MEASURAND_TARGET", "cpu"))
+
+
+def _as_uint(data: np.ndarray) -> np.ndarray:
+    # The signed integer kernels only accept unsigned input
+    if data.dtype.kind != "u":
+        return data.astype(np.uint64)
+    return data
 
 
 class Interp(MeasurandModifier):
+    """The interpretation of the raw bits of a `Parameter`.
+
+    Attributes
+    ----------
+    target : {"cpu", "parallel"} or None
+        The numba target of the conversion, or None to use the target set
+        with `set_target`.
+    """
+
     SIZE: ClassVar[Optional[int]] = None
+    target: Optional[Target] = None
+
+    def _ufunc(self, name: str) -> np.ufunc:
+        target = self.target or _target
+        return getattr(ufunc_parallel if target == "parallel" else ufunc, name)
 
     def apply_paarray(self, data: pa.Array, bits: int) -> pa.Array:
-        result = self.apply_ndarray(data.to_numpy(), bits)
-        return pa.array(result)
+        # Decode the value buffer of each chunk in place of a `to_numpy`
+        # round trip, which copies chunked arrays and fails on nulls
+        return _map_paarray(data, lambda x: self.apply_ndarray(x, bits))
 
 
 class InvalidInterpType(ValueError):
@@ -40,17 +84,22 @@ class Unsigned(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
         return data
 
+    def apply_paarray(self, data: pa.Array, bits: int) -> pa.Array:
+        return data
+
 
 @interp.register("1c")
 class OnesComplement(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
-        return tcu.onescomp(data, bits)
+        data = _as_uint(data)
+        return self._ufunc("onescomp")(data, np.uint8(bits))
 
 
 @interp.register("2c")
 class TwosComplement(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
-        return tcu.twoscomp(data, bits)
+        data = _as_uint(data)
+        return self._ufunc("twoscomp")(data, np.uint8(bits))
 
 
 @interp.register("ieee16")
@@ -90,7 +139,7 @@ class MilStd1750A32(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
         if bits != self.SIZE:
             raise InvalidInterpSize(self.__class__, self.SIZE, bits)
-        return tcu.milstd1750a32(data)
+        return self._ufunc("milstd1750a32")(data.astype(np.uint32, copy=False))
 
 
 @interp.register("1750a48")
@@ -100,7 +149,7 @@ class MilStd1750A48(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
         if bits != self.SIZE:
             raise InvalidInterpSize(self.__class__, self.SIZE, bits)
-        return tcu.milstd1750a48(data)
+        return self._ufunc("milstd1750a48")(data.astype(np.uint64, copy=False))
 
 
 @interp.register("ti32")
@@ -110,7 +159,7 @@ class TI32(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
         if bits != self.SIZE:
             raise InvalidInterpSize(self.__class__, self.SIZE, bits)
-        return tcu.ti32(data)
+        return self._ufunc("ti32")(data.astype(np.uint32, copy=False))
 
 
 @interp.register("ti40")
@@ -120,7 +169,7 @@ class TI40(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
         if bits != self.SIZE:
             raise InvalidInterpSize(self.__class__, self.SIZE, bits)
-        return tcu.ti40(data)
+        return self._ufunc("ti40")(data.astype(np.uint64, copy=False))
 
 
 @interp.register("ibm32")
@@ -130,7 +179,7 @@ class IBM32(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
         if bits != self.SIZE:
             raise InvalidInterpSize(self.__class__, self.SIZE, bits)
-        return tcu.ibm32(data)
+        return self._ufunc("ibm32")(data.astype(np.uint32, copy=False))
 
 
 @interp.register("ibm64")
@@ -140,7 +189,7 @@ class IBM64(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
         if bits != self.SIZE:
             raise InvalidInterpSize(self.__class__, self.SIZE, bits)
-        return tcu.ibm64(data)
+        return self._ufunc("ibm64")(data.astype(np.uint64, copy=False))
 
 
 @interp.register("dec32")
@@ -150,7 +199,7 @@ class DEC32(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
         if bits != self.SIZE:
             raise InvalidInterpSize(self.__class__, self.SIZE, bits)
-        return tcu.dec32(data)
+        return self._ufunc("dec32")(data.astype(np.uint32, copy=False))
 
 
 @interp.register("dec64")
@@ -160,7 +209,7 @@ class DEC64(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
         if bits != self.SIZE:
             raise InvalidInterpSize(self.__class__, self.SIZE, bits)
-        return tcu.dec64(data)
+        return self._ufunc("dec64")(data.astype(np.uint64, copy=False))
 
 
 @interp.register("dec64g")
@@ -170,8 +219,14 @@ class DEC64G(Interp):
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
         if bits != self.SIZE:
             raise InvalidInterpSize(self.__class__, self.SIZE, bits)
-        return tcu.dec64g(data)
+        return self._ufunc("dec64g")(data.astype(np.uint64, copy=False))
+
+
+@interp.register("bcd")
+class BCD(Interp):
+    def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
+        return self._ufunc("bcd")(data.astype(np.uint64, copy=False))
 
 
-def make_interp(spec: str) -> Interp:
-    return interp.create(spec)
+def make_interp(spec: str, target: Optional[Target] = None) -> Interp:
+    return interp.create(spec, target=target)
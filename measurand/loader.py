@@ -0,0 +1,236 @@
+import csv
+import gc
+import json
+import os
+import pickle
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Optional, Sequence, Union
+
+from measurand.component import Component, make_component
+from measurand.euc import EUC, make_euc
+from measurand.interp import Interp, make_interp
+from measurand.measurand import Measurand
+from measurand.measurand_set import MeasurandSet
+from measurand.parameter import Parameter
+from measurand.utils import _expand_component_range
+
+PathLike = Union[str, os.PathLike]
+
+# The header of a binary measurand database, followed by a pickled
+# `MeasurandSet`. The last byte is the version of the format.
+MAGIC = b"MEASURANDSET\x00\x01"
+
+SPEC_FORMATS = ("csv", "json", "yaml")
+
+
+class _SpecParser:
+    # Parses measurand specs like `make_measurand`, but every distinct
+    # component, parameter, interp and EUC spec is parsed and validated once
+    # and its model shared by every measurand using it. Models assembled from
+    # parts which are already validated are built with `model_construct`.
+
+    def __init__(self, word_size: int = 8, one_based: bool = True) -> None:
+        self.word_size = word_size
+        self.one_based = one_based
+        self._components: Dict[str, Component] = {}
+        self._parameters: Dict[str, Parameter] = {}
+        self._interps: Dict[str, Interp] = {}
+        self._eucs: Dict[str, EUC] = {}
+
+    def component(self, spec: str) -> Component:
+        if spec not in self._components:
+            self._components[spec] = make_component(
+                spec, word_size=self.word_size, one_based=self.one_based
+            )
+        return self._components[spec]
+
+    def parameter(self, spec: str) -> Parameter:
+        if spec not in self._parameters:
+            components = _expand_component_range(spec).split("+")
+            self._parameters[spec] = Parameter.model_construct(
+                components=tuple(self.component(s) for s in components),
+                word_size=self.word_size,
+                one_based=self.one_based,
+            )
+        return self._parameters[spec]
+
+    def interp(self, spec: str) -> Interp:
+        if spec not in self._interps:
+            self._interps[spec] = make_interp(spec)
+        return self._interps[spec]
+
+    def euc(self, spec: str) -> EUC:
+        if spec not in self._eucs:
+            self._eucs[spec] = make_euc(spec)
+        return self._eucs[spec]
+
+    def measurand(self, spec: str) -> Measurand:
+        parts = spec.split(";")
+        return Measurand.model_construct(
+            parameter=self.parameter(parts[0]),
+            interp=self.interp(parts[1]) if len(parts) >= 2 else None,
+            euc=self.euc(parts[2]) if len(parts) >= 3 else None,
+            sampling=None,
+            fused=False,
+        )
+
+
+def _read_csv(path: Path) -> Dict[str, str]:
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        if not {"name", "spec"} <= set(reader.fieldnames or ()):
+            raise ValueError(f"{path} needs a 'name' and a 'spec' column")
+        return {row["name"]: row["spec"] for row in reader}
+
+
+def _read_json(path: Path) -> Union[Mapping[str, str], Sequence[str]]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _read_yaml(path: Path) -> Union[Mapping[str, str], Sequence[str]]:
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError("reading YAML specs requires PyYAML") from e
+
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def _spec_format(path: Path) -> str:
+    suffix = path.suffix.lower().lstrip(".")
+    suffix = {"yml": "yaml"}.get(suffix, suffix)
+    if suffix not in SPEC_FORMATS:
+        raise ValueError(f"format of {path} not recognized, pass one of {SPEC_FORMATS}")
+    return suffix
+
+
+def read_specs(path: PathLike, format: Optional[str] = None) -> Dict[str, str]:
+    """Read the measurand specs of a CSV, JSON or YAML file.
+
+    A CSV file has a header row naming a ``name`` and a ``spec`` column. A
+    JSON or YAML file holds either a mapping of name to spec, or a list of
+    specs, which are named after their position in the list.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file to read.
+    format : {"csv", "json", "yaml"}, optional
+        The format of the file, by default inferred from its suffix.
+
+    Returns
+    -------
+    dict of str to str
+        The spec of each measurand, keyed by name.
+    """
+    path = Path(path)
+    format = format or _spec_format(path)
+    readers = {"csv": _read_csv, "json": _read_json, "yaml": _read_yaml}
+    if format not in readers:
+        raise ValueError(f"format {format!r} not valid")
+
+    specs = readers[format](path)
+    if isinstance(specs, Mapping):
+        return {str(name): str(spec) for name, spec in specs.items()}
+    if isinstance(specs, list):
+        return {str(i): str(spec) for i, spec in enumerate(specs)}
+    raise ValueError(f"{path} holds neither a mapping nor a list of specs")
+
+
+def parse_specs(
+    specs: Union[Mapping[str, str], Sequence[str]],
+    word_size: int = 8,
+    one_based: bool = True,
+) -> MeasurandSet:
+    """Parse many measurand specs into a `MeasurandSet`.
+
+    The result is equal to ``make_measurand_set(specs, ...)``, but every
+    distinct component, parameter, interp and EUC spec is parsed once and
+    its model is shared by all of the measurands using it, which makes
+    large databases of specs much faster to load.
+    """
+    if not isinstance(specs, Mapping):
+        specs = {str(i): spec for i, spec in enumerate(specs)}
+    parser = _SpecParser(word_size=word_size, one_based=one_based)
+    measurands = {name: parser.measurand(spec) for name, spec in specs.items()}
+    return MeasurandSet.model_construct(measurands=measurands)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Unpickling allocates many objects which all stay alive, so the cyclic
+    # garbage collector would repeatedly scan them for nothing
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _is_binary(path: Path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_measurand_set(
+    path: PathLike,
+    word_size: int = 8,
+    one_based: bool = True,
+    format: Optional[str] = None,
+) -> MeasurandSet:
+    """Load a `MeasurandSet` from a file of specs or a binary database.
+
+    Files written by `save_measurand_set` are recognized by their header and
+    are reloaded without parsing any spec; `word_size`, `one_based` and
+    `format` are then ignored. Binary databases are pickles, so only load
+    those from trusted sources.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        A CSV, JSON or YAML file of specs, as for `read_specs`, or a binary
+        database.
+    word_size : int, default 8
+        The size of each word in bits.
+    one_based : bool, default True
+        Whether the word and bit numbers of the specs are 1-based.
+    format : {"csv", "json", "yaml"}, optional
+        The format of a file of specs, by default inferred from its suffix.
+
+    Returns
+    -------
+    MeasurandSet
+    """
+    path = Path(path)
+    if _is_binary(path):
+        with open(path, "rb") as f:
+            f.seek(len(MAGIC))
+            with _gc_paused():
+                return pickle.load(f)
+
+    specs = read_specs(path, format=format)
+    return parse_specs(specs, word_size=word_size, one_based=one_based)
+
+
+def save_measurand_set(measurands: MeasurandSet, path: PathLike) -> None:
+    """Save a `MeasurandSet` as a binary database.
+
+    Models shared between measurands are stored once, so a database parsed
+    with `parse_specs` or `load_measurand_set` stays compact. Reload it with
+    `load_measurand_set`.
+
+    Parameters
+    ----------
+    measurands : MeasurandSet
+    path : str or os.PathLike
+    """
+    # Only the measurands are saved, not the build plan cached on the set
+    measurands = MeasurandSet.model_construct(measurands=dict(measurands.measurands))
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        pickle.dump(measurands, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -1,64 +1,154 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Tuple
 
 import numpy as np
 import pyarrow as pa
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from measurand.concurrent import DEFAULT_CHUNK_ROWS, build_threaded
 from measurand.euc import EUC, make_euc
+from measurand.generic import MeasurandModifier
 from measurand.interp import Interp, make_interp
 from measurand.parameter import DataArray, Parameter, make_parameter
+from measurand.sampling import Sampling
+from measurand.stream import Chunk, build_chunks
+from measurand.utils import _map_columns, _row_mask
 
-# from .sampling import SamplingStrategy
+if TYPE_CHECKING:
+    from measurand.fused import FusedKernel
 
 
 class Measurand(BaseModel):
     parameter: Parameter
     interp: Optional[Interp] = None
     euc: Optional[EUC] = None
-    # sampling: Optional[Sampling] = None
+    sampling: Optional[Sampling] = None
+    fused: bool = Field(default=False, frozen=True)
 
     @property
     def size(self) -> int:
         return self.parameter.size
 
+    @property
+    def _stages(self) -> Tuple[MeasurandModifier, ...]:
+        stages = (self.interp, self.euc, self.sampling)
+        if self.sampling and self.sampling._commutes_with(self.euc):
+            # Sample before the EUC so it only runs on the reduced data
+            stages = (self.interp, self.sampling, self.euc)
+        return tuple(stage for stage in stages if stage)
+
+    @property
+    def _window(self) -> int:
+        return self.sampling.window if self.sampling else 1
+
+    @property
+    def _key(self) -> tuple:
+        return (self.parameter._key,) + tuple(
+            stage._key if stage else None for stage in (self.interp, self.euc)
+        )
+
+    @property
+    def kernel(self) -> "FusedKernel":
+        # Looked up on every use, rather than cached on the instance, so a
+        # copy or an assignment to a stage never runs a stale kernel
+        from measurand.fused import kernel_cache
+
+        return kernel_cache.get(self)
+
     @classmethod
     def from_spec(cls, spec: str) -> "Measurand":
         return make_measurand(spec)
 
     def build(self, data: DataArray) -> DataArray:
+        if isinstance(data, np.ma.MaskedArray):
+            return self._build_masked(data)
         if isinstance(data, np.ndarray):
             return self._build_ndarray(data)
         if isinstance(data, pa.Table):
             return self._build_paarray(data)
         raise TypeError
 
+    def build_chunks(self, chunks: Iterable[Chunk]) -> Iterator[DataArray]:
+        return build_chunks(self, chunks)
+
+    def build_threaded(
+        self,
+        data: DataArray,
+        workers: Optional[int] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ) -> DataArray:
+        return build_threaded(self, data, workers, chunk_rows)
+
+    def build_bitstream(
+        self, data: np.ndarray, frame_bits: Optional[int] = None
+    ) -> np.ndarray:
+        tmp = self.parameter.build_bitstream(data, frame_bits)
+
+        for stage in self._stages:
+            tmp = stage.apply_ndarray(tmp, self.parameter.size)
+
+        return tmp
+
     def _build_ndarray(self, data: np.ndarray) -> np.ndarray:
+        if self.fused:
+            tmp = self.kernel(data)
+            if self.sampling:
+                tmp = self.sampling.apply_ndarray(tmp, self.parameter.size)
+            return tmp
+
         tmp = self.parameter._build_ndarray(data)
 
-        if self.interp:
-            tmp = self.interp.apply_ndarray(tmp, self.parameter.size)
+        for stage in self._stages:
+            tmp = stage.apply_ndarray(tmp, self.parameter.size)
+
+        return tmp
+
+    def _build_masked(self, data: np.ma.MaskedArray) -> np.ma.MaskedArray:
+        if self.fused:
+            tmp = np.atleast_2d(data)
+            mask = _row_mask(tmp, self.parameter.words)
+            tmp = np.ma.MaskedArray(self.kernel(tmp.data), mask=mask)
+            if self.sampling:
+                tmp = _apply_masked(self.sampling, tmp, self.parameter.size)
+            return tmp
+
+        tmp = self.parameter._build_masked(data)
 
-        if self.euc:
-            tmp = self.euc.apply_ndarray(tmp, self.parameter.size)
+        for stage in self._stages:
+            tmp = _apply_masked(stage, tmp, self.parameter.size)
 
         return tmp
 
     def _build_paarray(self, data: pa.Table) -> pa.Array:
-        tmp = self.parameter._build_paarray(data)
+        if self.fused:
+            tmp = _map_columns(data, self.kernel.words, self.kernel.apply_columns)
+            if self.sampling:
+                tmp = self.sampling.apply_paarray(tmp, self.parameter.size)
+            return tmp
 
-        if self.interp:
-            tmp = self.interp.apply_paarray(tmp, self.parameter.size)
+        tmp = self.parameter._build_paarray(data)
 
-        if self.euc:
-            tmp = self.euc.apply_paarray(tmp, self.parameter.size)
+        for stage in self._stages:
+            tmp = stage.apply_paarray(tmp, self.parameter.size)
 
         return tmp
 
 
-def make_measurand(spec: str, word_size: int = 8, one_based: bool = True) -> Measurand:
+def _apply_masked(
+    stage: MeasurandModifier, data: np.ma.MaskedArray, bits: int
+) -> np.ma.MaskedArray:
+    # Interps and EUCs are applied to every value, masked or not, and keep the
+    # mask. `Sampling` reduces the valid values only.
+    if isinstance(stage, Sampling):
+        return np.ma.asarray(stage.apply_ndarray(data, bits))
+    return np.ma.MaskedArray(stage.apply_ndarray(data.data, bits), mask=data.mask)
+
+
+def make_measurand(
+    spec: str, word_size: int = 8, one_based: bool = True, fused: bool = False
+) -> Measurand:
     parts = spec.split(";")
     parameter = make_parameter(parts[0], word_size=word_size, one_based=one_based)
-    mapping = {"parameter": parameter}
+    mapping = {"parameter": parameter, "fused": fused}
 
     if len(parts) >= 2:
         mapping["interp"] = make_interp(parts[1])
@@ -0,0 +1,228 @@
+from collections import Counter
+from functools import cached_property
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pyarrow as pa
+from pydantic import BaseModel, field_validator
+
+from measurand.component import Component
+from measurand.concurrent import DEFAULT_CHUNK_ROWS, build_threaded
+from measurand.generic import MeasurandModifier
+from measurand.measurand import Measurand, _apply_masked, make_measurand
+from measurand.parameter import DataArray, Parameter
+from measurand.stream import Chunk, build_chunks
+from measurand.utils import _row_mask
+
+
+class MeasurandSet(BaseModel):
+    """A collection of `Measurand` objects built together from one input.
+
+    `MeasurandSet` plans the build of many measurands at once. Every distinct
+    word referenced by any of the measurands is read from the input a single
+    time, and identical components, parameters and interp/EUC stages are
+    evaluated once and shared between all of the measurands using them. The
+    cost of a build therefore scales with the number of distinct words and
+    stages rather than the number of measurands.
+
+    Measurands with identical specifications share the same output array.
+
+    Parameters
+    ----------
+    measurands : dict of str to Measurand, or sequence of Measurand
+        The measurands to build, keyed by output name. A sequence is keyed by
+        the position of each measurand in the sequence.
+    """
+
+    measurands: Dict[str, Measurand]
+
+    @field_validator("measurands", mode="before")
+    @classmethod
+    def _name_measurands(cls, v):
+        if isinstance(v, (list, tuple)):
+            return {str(i): m for i, m in enumerate(v)}
+        return v
+
+    def __len__(self) -> int:
+        return len(self.measurands)
+
+    @cached_property
+    def words(self) -> Tuple[int, ...]:
+        return tuple(
+            sorted(
+                {
+                    comp.word
+                    for m in self.measurands.values()
+                    for comp in m.parameter.components
+                }
+            )
+        )
+
+    @cached_property
+    def _gathered_words(self) -> Tuple[int, ...]:
+        return tuple(
+            sorted(
+                {
+                    comp.word
+                    for m in self.measurands.values()
+                    if m.parameter._word_run is None
+                    for comp in m.parameter.components
+                }
+            )
+        )
+
+    @cached_property
+    def _window(self) -> int:
+        windows = [m._window for m in self.measurands.values()]
+        return int(np.lcm.reduce(windows)) if windows else 1
+
+    @cached_property
+    def _plan(self) -> Tuple[Dict[tuple, Parameter], Dict[str, List[tuple]]]:
+        parameters = {}
+        chains = {}
+        for name, m in self.measurands.items():
+            key = (m.parameter._key,)
+            parameters.setdefault(key, m.parameter)
+            chain = [key]
+            for stage in m._stages:
+                key = key + (stage._key,)
+                chain.append(key)
+            chains[name] = chain
+        return parameters, chains
+
+    def build(self, data: DataArray) -> Union[Dict[str, np.ndarray], pa.Table]:
+        if isinstance(data, np.ma.MaskedArray):
+            return self._build_masked(data)
+        if isinstance(data, np.ndarray):
+            return self._build_ndarray(data)
+        if isinstance(data, pa.Table):
+            return self._build_paarray(data)
+        raise TypeError
+
+    def build_chunks(
+        self, chunks: Iterable[Chunk]
+    ) -> Iterator[Union[Dict[str, np.ndarray], pa.Table]]:
+        return build_chunks(self, chunks)
+
+    def build_threaded(
+        self,
+        data: DataArray,
+        workers: Optional[int] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ) -> Union[Dict[str, np.ndarray], pa.Table]:
+        return build_threaded(self, data, workers, chunk_rows)
+
+    def _concatenator(self, data: np.ndarray) -> Callable[[Parameter], np.ndarray]:
+        # Gather every word referenced by a parameter, other than those of runs
+        # of whole words, with a single pass over the input
+        block = np.ascontiguousarray(data[:, self._gathered_words].T)
+        columns = dict(zip(self._gathered_words, block))
+
+        components = {}
+
+        def extract(comp: Component) -> np.ndarray:
+            if comp._key not in components:
+                column = columns.get(comp.word)
+                if column is None:
+                    column = data[:, comp.word]
+                components[comp._key] = comp._extract_ndarray(column)
+            return components[comp._key]
+
+        def concatenate(param: Parameter) -> np.ndarray:
+            out = param._view_word_run(data)
+            if out is None:
+                out = param._concatenate_ndarray(extract, data.shape[0])
+            return out
+
+        return concatenate
+
+    def _build_ndarray(self, data: np.ndarray) -> Dict[str, np.ndarray]:
+        concatenate = self._concatenator(np.atleast_2d(data))
+        return self._evaluate(
+            concatenate, lambda stage, tmp, bits: stage.apply_ndarray(tmp, bits)
+        )
+
+    def _build_masked(self, data: np.ma.MaskedArray) -> Dict[str, np.ma.MaskedArray]:
+        tmp = np.atleast_2d(data)
+        concatenate = self._concatenator(tmp.data)
+
+        def masked(param: Parameter) -> np.ma.MaskedArray:
+            return np.ma.MaskedArray(
+                concatenate(param), mask=_row_mask(tmp, param.words)
+            )
+
+        return self._evaluate(masked, _apply_masked)
+
+    def _check_table_windows(self) -> None:
+        # The columns of a table must all have the same length, so every
+        # measurand needs the same `Sampling` window
+        windows = sorted({m._window for m in self.measurands.values()})
+        if len(windows) > 1:
+            raise ValueError(
+                f"measurands with different sampling windows {windows} cannot "
+                "be built into one table; build them as separate sets"
+            )
+
+    def _build_paarray(self, data: pa.Table) -> pa.Table:
+        if not isinstance(data, pa.Table):
+            raise TypeError
+        self._check_table_windows()
+
+        results = self._evaluate(
+            lambda param: param._build_paarray(data),
+            lambda stage, tmp, bits: stage.apply_paarray(tmp, bits),
+        )
+        return pa.Table.from_arrays(list(results.values()), names=list(results))
+
+    def _evaluate(
+        self,
+        concatenate: Callable[[Parameter], DataArray],
+        apply: Callable[[MeasurandModifier, DataArray, int], DataArray],
+    ) -> Dict[str, DataArray]:
+        parameters, chains = self._plan
+
+        # Build every distinct parameter first, so the component cache held
+        # by `concatenate` can be released before the stages are applied
+        cache = {key: concatenate(param) for key, param in parameters.items()}
+
+        # Intermediate results are released once their last consumer has run
+        outputs = {chain[-1] for chain in chains.values()}
+        pending = Counter(key for chain in chains.values() for key in chain[:-1])
+
+        results = {}
+        for name, chain in chains.items():
+            bits = self.measurands[name].size
+            stages = self.measurands[name]._stages
+            for src, dst, stage in zip(chain, chain[1:], stages):
+                if dst not in cache:
+                    cache[dst] = apply(stage, cache[src], bits)
+                pending[src] -= 1
+                if not pending[src] and src not in outputs:
+                    del cache[src]
+            results[name] = cache[chain[-1]]
+        return results
+
+
+def make_measurand_set(
+    specs: Union[Mapping[str, str], Sequence[str]],
+    word_size: int = 8,
+    one_based: bool = True,
+) -> MeasurandSet:
+    if not isinstance(specs, Mapping):
+        specs = {str(i): spec for i, spec in enumerate(specs)}
+    measurands = {
+        name: make_measurand(spec, word_size=word_size, one_based=one_based)
+        for name, spec in specs.items()
+    }
+    return MeasurandSet(measurands=measurands)
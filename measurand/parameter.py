@@ -1,22 +1,49 @@
+import sys
 from functools import cached_property
-from typing import Tuple, Union
+from typing import Callable, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pyarrow as pa
-import pyarrow.compute as pac
+from numba import literal_unroll, njit
 from pydantic import BaseModel, Field
 
 from measurand.component import Component, make_component
-from measurand.utils import _expand_component_range, _size_to_uint
+from measurand.utils import (
+    _expand_component_range,
+    _map_columns,
+    _reverse_bits_scalar,
+    _row_mask,
+    _size_to_uint,
+)
 
 DataArray = Union[np.ndarray, pa.Table]
 
 
+@njit(nogil=True, cache=True)
+def _concatenate_words(components, out) -> None:
+    # Assemble each row of `out` from the (column, mask, shift, size, reverse)
+    # of each of its components, most significant first, in a single pass
+    # without any intermediate arrays
+    for i in range(out.shape[0]):
+        raw = np.uint64(0)
+        for component in literal_unroll(components):
+            column, mask, shift, size, reverse = component
+            value = (np.uint64(column[i]) & mask) >> shift
+            if reverse:
+                value = _reverse_bits_scalar(value, size)
+            raw = (raw << size) | value
+        out[i] = raw
+
+
 class Parameter(BaseModel):
     components: Tuple[Component, ...]
     one_based: bool = Field(default=True, frozen=True)
     word_size: int = Field(default=8, frozen=True)
 
+    @property
+    def _key(self) -> tuple:
+        return tuple(c._key for c in self.components)
+
     def __eq__(self, other: "Parameter") -> bool:
         if len(self.components) != len(other.components):
             return False
@@ -25,6 +52,9 @@ class Parameter(BaseModel):
                 return False
         return True
 
+    def __hash__(self) -> int:
+        return hash(self._key)
+
     @cached_property
     def size(self) -> int:
         return sum([c.size for c in self.components])
@@ -38,36 +68,178 @@ class Parameter(BaseModel):
         return make_parameter(spec, word_size=word_size)
 
     def build(self, data: DataArray) -> DataArray:
+        if isinstance(data, np.ma.MaskedArray):
+            return self._build_masked(data)
         if isinstance(data, np.ndarray):
             return self._build_ndarray(data)
         if isinstance(data, pa.Table):
             return self._build_paarray(data)
         raise TypeError
 
+    @cached_property
+    def _word_run(self) -> Optional[Tuple[int, int, str]]:
+        """The first word, word count and byte order of a run of whole words.
+
+        A parameter made of whole, consecutive, byte-aligned words is the
+        bytes of those words reinterpreted as one integer; most significant
+        word first is a big-endian run, least significant first little-endian.
+        """
+        comps = self.components
+        if len(comps) < 2 or self.word_size not in (8, 16, 32):
+            return None
+        if self.size not in (16, 32, 64):
+            return None
+        full = (1 << self.word_size) - 1
+        for comp in comps:
+            if comp.mask not in (None, full) or comp.shift or comp.reverse:
+                return None
+        words = [comp.word for comp in comps]
+        first = min(words)
+        if words == list(range(first, first + len(words))):
+            return first, len(words), ">"
+        if words == list(range(first + len(words) - 1, first - 1, -1)):
+            return first, len(words), "<"
+        return None
+
+    @cached_property
+    def words(self) -> Tuple[int, ...]:
+        return tuple(sorted({c.word for c in self.components}))
+
+    @cached_property
+    def _kernel_components(self) -> Tuple[tuple, ...]:
+        # The mask, shift, size and reverse of each component. A tuple, rather
+        # than arrays, lets numba specialize the kernel on the number of
+        # components.
+        return tuple(
+            (
+                np.uint64(c.mask or (1 << c.word_size) - 1),
+                np.uint64(c.shift),
+                np.uint64(c.size),
+                c.reverse,
+            )
+            for c in self.components
+        )
+
+    def _view_word_run(self, data: np.ndarray) -> Optional[np.ndarray]:
+        # Bytes of a run of words in the byte order of the words themselves
+        # are viewed as a single integer, without any arithmetic. The view is
+        # returned as is in native byte order, and otherwise copied once with
+        # its bytes swapped. Only input holding exactly one word per element
+        # has the bytes of the words.
+        if self._word_run is None or data.dtype.itemsize * 8 != self.word_size:
+            return None
+        first, count, byteorder = self._word_run
+        if data.dtype.itemsize > 1 and byteorder != _byteorder(data.dtype):
+            return None
+        block = data[:, first : first + count]
+        if block.strides[1] != block.itemsize:
+            return None
+        # NumPy < 1.23 only views C-contiguous arrays as a wider dtype
+        block = np.ascontiguousarray(block)
+        out = block.view(np.dtype(self.output_dtype).newbyteorder(byteorder))[:, 0]
+        return out if out.dtype.isnative else out.astype(self.output_dtype)
+
+    def _build_masked(self, data: np.ma.MaskedArray) -> np.ma.MaskedArray:
+        # A value is masked where any of the words it is built from is masked
+        tmp = np.atleast_2d(data)
+        out = self._build_ndarray(tmp.data)
+        return np.ma.MaskedArray(out, mask=_row_mask(tmp, self.words))
+
     def _build_ndarray(self, data: np.ndarray) -> np.ndarray:
         tmp = np.atleast_2d(data)
-        dtype = _size_to_uint(self.size)
-        result = np.zeros(tmp.shape[0], dtype=dtype)
-        size = 0
-        for comp in reversed(self.components):
-            result += comp._build_ndarray(tmp).astype(dtype) << size
-            size += comp.size
-        return result
+
+        out = self._view_word_run(tmp)
+        if out is not None:
+            return out
+
+        return self._concatenate_columns([tmp[:, word] for word in self.words])
+
+    def _concatenate_columns(self, columns: Sequence[np.ndarray]) -> np.ndarray:
+        # `columns` holds a 1-D array of each of `words`
+        columns = dict(zip(self.words, columns))
+        rows = len(columns[self.words[0]])
+        dtypes = {column.dtype for column in columns.values()}
+
+        # numba only handles native byte order, and a tuple of columns of a
+        # single type. A single component, which may be 64 bits wide, is left
+        # to NumPy, as a shift by 64 bits is undefined.
+        if len(self.components) > 1 and len(dtypes) == 1 and dtypes.pop().isnative:
+            components = tuple(
+                (columns[comp.word], *args)
+                for comp, args in zip(self.components, self._kernel_components)
+            )
+            out = np.empty(rows, dtype=self.output_dtype)
+            _concatenate_words(components, out)
+            return out
+
+        return self._concatenate_ndarray(
+            lambda comp: comp._extract_ndarray(columns[comp.word]), rows
+        )
+
+    def build_bitstream(
+        self, data: np.ndarray, frame_bits: Optional[int] = None
+    ) -> np.ndarray:
+        """Build the parameter directly from packed, big-endian frames.
+
+        Each component is extracted straight from its bit offset within the
+        frame, without first unpacking the frame into words.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            Bytes of the bitstream; either a 2-D array with one byte-aligned
+            frame per row, or a 1-D array of frames packed back to back.
+        frame_bits : int, optional
+            The length of each frame in bits. Required for 1-D `data`.
+        """
+        tmp = np.asarray(data, dtype=np.uint8)
+        if tmp.ndim == 1:
+            if not frame_bits:
+                raise ValueError("frame_bits is required for a 1-D bitstream")
+            if frame_bits % 8 == 0:
+                frame_bytes = frame_bits // 8
+                frames = len(tmp) // frame_bytes
+                tmp = tmp[: frames * frame_bytes].reshape(frames, frame_bytes)
+                frame_bits = None
+            else:
+                frames = len(tmp) * 8 // frame_bits
+                tmp = tmp[np.newaxis, :]
+        else:
+            frames = tmp.shape[0]
+            frame_bits = None
+
+        return self._concatenate_ndarray(
+            lambda comp: comp._build_bitstream(tmp, frame_bits), frames
+        )
 
     def _build_paarray(self, data: pa.Table) -> pa.Array:
         if not isinstance(data, pa.Table):
             raise TypeError
 
-        result = pa.array(np.zeros(len(data), dtype=self.output_dtype))
+        return _map_columns(data, self.words, self._concatenate_columns)
+
+    def _concatenate_ndarray(
+        self, extract: Callable[[Component], np.ndarray], rows: int
+    ) -> np.ndarray:
+        # A single temporary per component, which is shifted in place
+        dtype = np.dtype(_size_to_uint(self.size))
+        result = np.zeros(rows, dtype=dtype)
         size = 0
         for comp in reversed(self.components):
-            tmp = comp._build_paarray(data).cast(self.output_dtype)
-            tmp = pac.shift_left(tmp, np.uint8(size))
-            result = pac.add(result, tmp)
+            tmp = extract(comp).astype(dtype)
+            if size:
+                np.left_shift(tmp, dtype.type(size), out=tmp)
+            np.bitwise_or(result, tmp, out=result)
             size += comp.size
         return result
 
 
+def _byteorder(dtype: np.dtype) -> str:
+    return {"=": "<" if sys.byteorder == "little" else ">"}.get(
+        dtype.byteorder, dtype.byteorder
+    )
+
+
 def make_parameter(spec: str, word_size: int = 8, one_based: bool = True) -> Parameter:
     raw_param = _expand_component_range(spec)
     components = [
@@ -0,0 +1,107 @@
+import os
+from functools import cached_property
+from typing import Iterator, Literal, Optional, Union
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from measurand.utils import _extract_bits, _size_to_uint
+
+BYTE_ALIGNED_WORD_SIZES = (8, 16, 32, 64)
+
+
+class FrameFile(BaseModel):
+    """A memory-mapped file of fixed-length frames.
+
+    The frames of a recording are exposed as a 2-D array of words, one row
+    per frame, which `Measurand.build` and `Parameter.build` consume directly.
+    For byte-aligned word sizes this is a zero-copy view of the file. Words
+    of other sizes are packed into a big-endian bitstream and are unpacked
+    lazily, one chunk of frames at a time. Each frame starts on a byte
+    boundary.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The path of the recording.
+    frame_length : int
+        The number of words in each frame.
+    word_size : int, default 8
+        The size of each word in bits.
+    byteorder : {">", "<"}, default ">"
+        The byte order of multi-byte, byte-aligned words.
+    offset : int, default 0
+        The number of header bytes preceding the first frame.
+    """
+
+    path: Union[str, os.PathLike] = Field(frozen=True)
+    frame_length: int = Field(frozen=True)
+    word_size: int = Field(default=8, frozen=True)
+    byteorder: Literal[">", "<"] = Field(default=">", frozen=True)
+    offset: int = Field(default=0, frozen=True)
+
+    @property
+    def packed(self) -> bool:
+        return self.word_size not in BYTE_ALIGNED_WORD_SIZES
+
+    @cached_property
+    def frame_bytes(self) -> int:
+        return (self.frame_length * self.word_size + 7) // 8
+
+    @cached_property
+    def _raw(self) -> np.ndarray:
+        frames = (os.path.getsize(self.path) - self.offset) // self.frame_bytes
+        if frames <= 0:
+            # An empty file cannot be memory-mapped
+            return np.empty((0, self.frame_bytes), dtype=np.uint8)
+        return np.memmap(
+            self.path,
+            dtype=np.uint8,
+            mode="r",
+            offset=self.offset,
+            shape=(frames, self.frame_bytes),
+        )
+
+    def __getstate__(self) -> dict:
+        # Drop the memory map, so a pickled file is reopened rather than copied
+        state = super().__getstate__()
+        state["__dict__"] = {
+            k: v for k, v in state["__dict__"].items() if k not in ("_raw", "frames")
+        }
+        return state
+
+    def __len__(self) -> int:
+        return self._raw.shape[0]
+
+    @cached_property
+    def frames(self) -> np.ndarray:
+        """A zero-copy view of every frame, for byte-aligned word sizes."""
+        if self.packed:
+            raise ValueError(
+                f"{self.word_size}-bit words are packed; use read() or iter_chunks()"
+            )
+        dtype = np.dtype(_size_to_uint(self.word_size)).newbyteorder(self.byteorder)
+        return self._raw.view(dtype)
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Return frames `start` to `stop` as a 2-D array of words."""
+        if not self.packed:
+            return self.frames[start:stop]
+
+        raw = self._raw[start:stop]
+        offsets = np.arange(self.frame_length) * self.word_size
+        words = _extract_bits(raw, offsets, self.word_size)
+        return words.astype(_size_to_uint(self.word_size))
+
+    def read_bitstream(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Return frames `start` to `stop` as a zero-copy 2-D array of bytes.
+
+        The result can be passed straight to `Measurand.build_bitstream`.
+        """
+        return self._raw[start:stop]
+
+    def iter_chunks(self, rows: int, bitstream: bool = False) -> Iterator[np.ndarray]:
+        """Yield consecutive blocks of at most `rows` frames."""
+        read = self.read_bitstream if bitstream else self.read
+        for start in range(0, len(self), rows):
+            yield read(start, start + rows)
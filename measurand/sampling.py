@@ -1,19 +1,130 @@
-from typing import Literal
+from typing import Literal, Optional
 
 import numpy as np
 import pyarrow as pa
+from numba import njit
+from pydantic import Field
 
+from measurand.euc import EUC, ScaleFactorEUC
 from measurand.generic import MeasurandModifier
+from measurand.utils import _map_paarray
 
 SamplingStrategy = Literal["mean", "mode", "max", "min"]
 
 
+@njit(nogil=True)
+def _mode_ndarray(data: np.ndarray, offsets: np.ndarray, out: np.ndarray) -> None:
+    # Window `i` holds `data[offsets[i] : offsets[i + 1]]`; empty windows are
+    # left as they are
+    for i in range(out.shape[0]):
+        values = np.sort(data[offsets[i] : offsets[i + 1]])
+        if not values.shape[0]:
+            continue
+        best = values[0]
+        best_count = 0
+        count = 0
+        for j in range(values.shape[0]):
+            if j and values[j] == values[j - 1]:
+                count += 1
+            else:
+                count = 1
+            if count > best_count:
+                best = values[j]
+                best_count = count
+        out[i] = best
+
+
 class Sampling(MeasurandModifier):
-    window: int
+    """Reduce a `Measurand` to one value per window of consecutive frames.
+
+    Windows are aligned to the first frame. A trailing partial window is
+    reduced on its own, so the output has ``ceil(len(data) / window)`` values.
+    Ties in the "mode" strategy are resolved to the smallest value. Masked
+    or null values are left out of their window, and a window without any
+    valid value is masked or null.
+
+    Parameters
+    ----------
+    window : int
+        The number of frames reduced to a single value.
+    mode : {"mean", "mode", "max", "min"}
+        The reduction applied to each window.
+    """
+
+    window: int = Field(gt=0)
     mode: SamplingStrategy
 
+    def _commutes_with(self, euc: Optional[EUC]) -> bool:
+        # Whether sampling before the EUC gives the same result as after it,
+        # letting the EUC run on the reduced rather than the full-rate array
+        if euc is None:
+            return True
+        if not isinstance(euc, ScaleFactorEUC):
+            return False
+        if self.mode == "mean" or euc.scale_factor is None:
+            return True
+        if self.mode == "mode":
+            # A negative scale factor reverses the order of the values, which
+            # changes which of two tied values is the smallest
+            return euc.scale_factor > 0
+        return euc.scale_factor >= 0
+
+    def _reduce_ndarray(self, data: np.ndarray) -> np.ndarray:
+        if self.mode == "mean":
+            return data.mean(axis=1)
+        if self.mode == "max":
+            return data.max(axis=1)
+        if self.mode == "min":
+            return data.min(axis=1)
+        raise ValueError(f"sampling mode {self.mode!r} not valid")
+
+    def _mode_ndarray(self, data: np.ndarray) -> np.ndarray:
+        windows = (len(data) + self.window - 1) // self.window
+        mask = np.ma.getmask(data)
+        values = np.ma.getdata(data)
+        dtype = values.dtype.newbyteorder("=")
+        # numba has no float16, whose values all fit exactly in a float32
+        values = values.astype(np.float32 if dtype == np.float16 else dtype, copy=False)
+        if mask is np.ma.nomask or not mask.any():
+            offsets = np.minimum(np.arange(windows + 1) * self.window, len(data))
+            out = np.empty(windows, values.dtype)
+            _mode_ndarray(values, offsets, out)
+            return out.astype(dtype, copy=False)
+
+        # Reduce the valid values only, in windows delimited by the number of
+        # valid values in each window
+        valid = ~mask
+        counts = np.add.reduceat(valid, np.arange(0, len(data), self.window))
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        out = np.zeros(windows, values.dtype)
+        _mode_ndarray(values[valid], offsets, out)
+        return np.ma.MaskedArray(out.astype(dtype, copy=False), mask=counts == 0)
+
     def apply_ndarray(self, data: np.ndarray, bits: int) -> np.ndarray:
-        raise NotImplementedError
+        if self.mode == "mode":
+            return self._mode_ndarray(data)
+
+        aligned = len(data) - len(data) % self.window
+        result = self._reduce_ndarray(data[:aligned].reshape(-1, self.window))
+        if aligned < len(data):
+            tail = self._reduce_ndarray(data[np.newaxis, aligned:])
+            concatenate = np.ma.concatenate if np.ma.isMA(result) else np.concatenate
+            result = concatenate([result, tail])
+        return result
+
+    def apply_paarray(self, data: pa.Array, bits: int) -> pa.Array:
+        if pa.types.is_float16(data.type):
+            # Arrow can neither aggregate nor cast half floats
+            data = _map_paarray(data, lambda x: x.astype(np.float32))
+
+        if self.mode == "mode":
+            # Arrow has no grouped mode, so nulls are reduced as masked values
+            values = data.fill_null(0).to_numpy()
+            mask = data.is_null().to_numpy(zero_copy_only=False)
+            result = self._mode_ndarray(np.ma.MaskedArray(values, mask=mask))
+            return pa.array(np.ma.getdata(result), mask=np.ma.getmaskarray(result))
 
-    def apply_paarray(self, data: pa.Table, bits: int) -> pa.Table:
-        raise NotImplementedError
+        groups = pa.array(np.arange(len(data)) // self.window)
+        table = pa.table({"value": data, "window": groups})
+        result = table.group_by("window").aggregate([("value", self.mode)])
+        return result.sort_by("window")[f"value_{self.mode}"]
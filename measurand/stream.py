@@ -0,0 +1,73 @@
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+
+Chunk = Union[np.ndarray, pa.RecordBatch, pa.Table]
+
+
+def _as_table_or_ndarray(chunk: Chunk) -> Union[np.ndarray, pa.Table]:
+    if isinstance(chunk, pa.RecordBatch):
+        return pa.Table.from_batches([chunk])
+    if isinstance(chunk, np.ndarray):
+        return np.atleast_2d(chunk)
+    return chunk
+
+
+def _slice(chunk: Union[np.ndarray, pa.Table], start: int, stop: int):
+    if isinstance(chunk, pa.Table):
+        return chunk.slice(start, stop - start)
+    return chunk[start:stop]
+
+
+def _concatenate(a: Union[np.ndarray, pa.Table], b: Union[np.ndarray, pa.Table]):
+    if isinstance(a, pa.Table):
+        return pa.concat_tables([a, b])
+    if np.ma.isMA(a) or np.ma.isMA(b):
+        return np.ma.concatenate([a, b])
+    return np.concatenate([a, b])
+
+
+def _align_chunks(
+    chunks: Iterable[Chunk], multiple: int
+) -> Iterator[Union[np.ndarray, pa.Table]]:
+    # Re-chunk so that every chunk but the last has a multiple of `multiple`
+    # rows. Leftover rows are carried into the next chunk, so no window of a
+    # `Sampling` stage is split between chunks.
+    carry: Optional[Union[np.ndarray, pa.Table]] = None
+    for chunk in chunks:
+        chunk = _as_table_or_ndarray(chunk)
+        if carry is not None:
+            chunk = _concatenate(carry, chunk)
+        rows = len(chunk)
+        aligned = rows - rows % multiple
+        carry = _slice(chunk, aligned, rows) if aligned < rows else None
+        if aligned:
+            yield _slice(chunk, 0, aligned)
+    if carry is not None:
+        yield carry
+
+
+def build_chunks(builder, chunks: Iterable[Chunk]) -> Iterator:
+    """Build a `Measurand` or `MeasurandSet` over a stream of frame chunks.
+
+    Each chunk is built independently, so peak memory is bounded by the size
+    of a chunk rather than the size of the whole input. The concatenated
+    output chunks are identical to a single build over the whole input.
+
+    Parameters
+    ----------
+    builder : Measurand or MeasurandSet
+        The measurand(s) to build.
+    chunks : iterable of numpy.ndarray, pyarrow.RecordBatch or pyarrow.Table
+        Consecutive blocks of frames.
+
+    Yields
+    ------
+    The output of ``builder.build`` for each chunk.
+    """
+    multiple = builder._window
+    if multiple > 1:
+        chunks = _align_chunks(chunks, multiple)
+    for chunk in chunks:
+        yield builder.build(_as_table_or_ndarray(chunk))
@@ -0,0 +1,19 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def pow2(e: np.int32) -> np.float64:
+    """Return 2 ** e, built directly from its exponent bits.
+
+    Only exact for normal results, -1022 <= e <= 1023.
+    """
+    bits = np.uint64(np.int64(e) + np.int64(1023)) << np.uint8(52)
+    return np.uint64(bits).view(np.float64)
+
+
+@njit(cache=True)
+def with_sign(x: np.float64, s: np.uint64) -> np.float64:
+    """Return `x` with its sign bit set by `s`, in place of (-1) ** s * x."""
+    bits = np.float64(x).view(np.uint64) | (np.uint64(s) << np.uint8(63))
+    return np.uint64(bits).view(np.float64)
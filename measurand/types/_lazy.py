@@ -0,0 +1,54 @@
+import importlib
+import sys
+import threading
+from typing import Any, Callable, Iterable, List
+
+from numba import njit, vectorize
+
+# Compiling a kernel takes far longer than importing its module, so every
+# module of `measurand.types` compiles its `jfunc`, `ufunc` and multi-threaded
+# `ufunc_parallel` on first use rather than at import. The compiled kernels
+# are cached on disk by numba, which makes first use in later processes
+# nearly free.
+
+_lock = threading.RLock()
+
+_COMPILERS = {
+    "jfunc": lambda func, signatures: njit(signatures, cache=True)(func),
+    "ufunc": lambda func, signatures: vectorize(signatures, cache=True)(func),
+    "ufunc_parallel": lambda func, signatures: vectorize(
+        signatures, target="parallel", cache=True
+    )(func),
+}
+
+
+def lazy_kernels(
+    module: str, func: Callable, signatures: List[str]
+) -> Callable[[str], Any]:
+    """Return a module `__getattr__` that compiles the kernels of `func` lazily."""
+
+    def __getattr__(name: str) -> Any:
+        if name not in _COMPILERS:
+            raise AttributeError(f"module {module!r} has no attribute {name!r}")
+        with _lock:
+            namespace = vars(sys.modules[module])
+            if name not in namespace:
+                namespace[name] = _COMPILERS[name](func, signatures)
+            return namespace[name]
+
+    return __getattr__
+
+
+def lazy_aggregate(module: str, attr: str, names: Iterable[str]) -> Callable:
+    """Return a module `__getattr__` exposing `attr` of each named submodule."""
+    names = frozenset(names)
+    package = module.rpartition(".")[0]
+
+    def __getattr__(name: str) -> Any:
+        if name not in names:
+            raise AttributeError(f"module {module!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f"{package}.{name}"), attr)
+        vars(sys.modules[module])[name] = value
+        return value
+
+    return __getattr__
@@ -1,5 +1,6 @@
 import numpy as np
-from numba import njit, vectorize
+from ._bits import pow2, with_sign
+from ._lazy import lazy_kernels
 
 signatures = [
     'f8(u4)',
@@ -30,6 +31,19 @@ def func(value: np.uint32) -> np.float64:
     """
     value = np.uint32(value)
 
+    s = value >> np.uint8(31)
+    e = np.int32((value >> np.uint8(23)) & np.uint32(0xFF)) - np.int32(128)
+    m = value & np.uint32(0x007FFFFF)
+
+    M = np.float64(m) / np.float64(2**24) + np.float64(0.5)
+    x = M * pow2(e)
+    return with_sign(x, s)
+
+
+def reference_func(value: np.uint32) -> np.float64:
+    """The original implementation of `func`, kept to test it against."""
+    value = np.uint32(value)
+
     s = (value >> np.uint8(31)) * np.uint32(1)
     e = (value >> np.uint8(23)) & np.uint32(0xFF)
     m = (value & np.uint32(0x007FFFFF))
@@ -41,5 +55,4 @@ def func(value: np.uint32) -> np.float64:
     return np.float64(S * M * np.float64(2)**E)
 
 
-jfunc = njit(signatures)(func)
-ufunc = vectorize(signatures)(func)
+__getattr__ = lazy_kernels(__name__, func, signatures)
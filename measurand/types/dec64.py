@@ -1,5 +1,6 @@
 import numpy as np
-from numba import njit, vectorize
+from ._bits import pow2, with_sign
+from ._lazy import lazy_kernels
 
 signatures = [
     'f8(u8)',
@@ -30,6 +31,19 @@ def func(value: np.uint64) -> np.float64:
     """
     value = np.uint64(value)
 
+    s = value >> np.uint8(63)
+    e = np.int32((value >> np.uint8(55)) & np.uint64(0xFF)) - np.int32(128)
+    m = value & np.uint64(0x007FFFFFFFFFFFFF)
+
+    M = np.float64(m) / np.float64(2**56) + np.float64(0.5)
+    x = M * pow2(e)
+    return with_sign(x, s)
+
+
+def reference_func(value: np.uint64) -> np.float64:
+    """The original implementation of `func`, kept to test it against."""
+    value = np.uint64(value)
+
     s = (value >> np.uint8(63)) & np.uint64(1)
     e = (value >> np.uint8(55)) & np.uint64(0xFF)
     m = (value & np.uint64(0x007FFFFFFFFFFFFF))
@@ -41,5 +55,4 @@ def func(value: np.uint64) -> np.float64:
     return np.float64(S * M * np.float64(2)**E)
 
 
-jfunc = njit(signatures)(func)
-ufunc = vectorize(signatures)(func)
+__getattr__ = lazy_kernels(__name__, func, signatures)
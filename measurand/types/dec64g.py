@@ -1,5 +1,6 @@
 import numpy as np
-from numba import njit, vectorize
+from ._bits import with_sign
+from ._lazy import lazy_kernels
 
 signatures = [
     'f8(u8)',
@@ -30,6 +31,19 @@ def func(value: np.uint64) -> np.float64:
     """
     value = np.uint64(value)
 
+    s = value >> np.uint8(63)
+    e = np.int32((value >> np.uint8(52)) & np.uint64(0x7FF)) - np.int32(1024)
+    m = value & np.uint64(0x000FFFFFFFFFFFFF)
+
+    M = np.float64(m) / np.float64(2**53) + np.float64(0.5)
+    x = np.ldexp(M, e)
+    return with_sign(x, s)
+
+
+def reference_func(value: np.uint64) -> np.float64:
+    """The original implementation of `func`, kept to test it against."""
+    value = np.uint64(value)
+
     s = (value >> np.uint8(63)) & np.uint64(1)
     e = (value >> np.uint8(52)) & np.uint64(0x7FF)
     m = (value & np.uint64(0x000FFFFFFFFFFFFF))
@@ -38,8 +52,7 @@ def func(value: np.uint64) -> np.float64:
     E = np.int16(e) - np.int16(1024)
     M = np.float64(m) / np.float64(2**53) + np.float64(0.5)
 
-    return np.float64(S * M * np.float64(2)**E)
+    return np.float64(S * np.ldexp(M, E))
 
 
-jfunc = njit(signatures)(func)
-ufunc = vectorize(signatures)(func)
+__getattr__ = lazy_kernels(__name__, func, signatures)
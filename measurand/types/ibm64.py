@@ -1,5 +1,6 @@
 import numpy as np
-from numba import njit, vectorize
+from ._bits import pow2, with_sign
+from ._lazy import lazy_kernels
 
 signatures = [
     'f8(u8)',
@@ -30,6 +31,20 @@ def func(value: np.uint64) -> np.float64:
     """
     value = np.uint64(value)
 
+    s = value >> np.uint8(63)
+    e = np.int32((value >> np.uint8(56)) & np.uint64(0x7F)) - np.int32(64)
+    m = value & np.uint64(0x00FFFFFFFFFFFFFF)
+
+    # 16 ** e == 2 ** (4 * e)
+    M = np.float64(m) / np.float64(2**56)
+    x = M * pow2(np.int32(4) * e)
+    return with_sign(x, s)
+
+
+def reference_func(value: np.uint64) -> np.float64:
+    """The original implementation of `func`, kept to test it against."""
+    value = np.uint64(value)
+
     s = (value >> np.uint8(63)) * np.uint64(1)
     e = (value >> np.uint8(56)) & np.uint64(0x7F)
     m = (value & np.uint64(0x00FFFFFFFFFFFFFF))
@@ -41,5 +56,4 @@ def func(value: np.uint64) -> np.float64:
     return np.float64(S * M * np.float64(16)**E)
 
 
-jfunc = njit(signatures)(func)
-ufunc = vectorize(signatures)(func)
+__getattr__ = lazy_kernels(__name__, func, signatures)
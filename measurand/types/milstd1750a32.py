@@ -1,6 +1,7 @@
 import numpy as np
-from numba import njit, vectorize
-from .twoscomp import jfunc as uint_to_twoscomp
+from ._bits import pow2
+from ._lazy import lazy_kernels
+from . import twoscomp
 
 signatures = [
     'f4(u4)',
@@ -33,14 +34,26 @@ def func(value: np.uint32) -> np.float32:
     (<class 'numpy.float32'>, 0.5)
     """
     value = np.uint32(value)
-    m = uint_to_twoscomp(
+
+    # Sign-extend the 24-bit mantissa and the 8-bit exponent with shifts and
+    # casts rather than a two's complement conversion
+    m = np.int32(value) >> np.int32(8)
+    e = np.int32(np.int8(np.uint8(value & np.uint32(0x000000FF))))
+
+    M = np.float32(m) / np.float32(2**23)
+    return np.float32(np.float64(M) * pow2(e))
+
+
+def reference_func(value: np.uint32) -> np.float32:
+    """The original implementation of `func`, kept to test it against."""
+    value = np.uint32(value)
+    m = twoscomp.jfunc(
         (value & np.uint32(0xFFFFFF00)) >> np.uint8(8), np.uint8(24)
     )
-    e = uint_to_twoscomp(value & np.uint32(0x000000FF), np.uint8(8))
+    e = twoscomp.jfunc(value & np.uint32(0x000000FF), np.uint8(8))
     M = np.float32(m) / np.float32(2**23)
     E = np.float32(e)
     return np.float32(M * 2 ** E)
 
 
-jfunc = njit(signatures)(func)
-ufunc = vectorize(signatures)(func)
+__getattr__ = lazy_kernels(__name__, func, signatures)
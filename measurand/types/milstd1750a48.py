@@ -1,6 +1,7 @@
 import numpy as np
-from numba import njit, vectorize
-from .twoscomp import jfunc as uint_to_twoscomp
+from ._bits import pow2
+from ._lazy import lazy_kernels
+from . import twoscomp
 
 signatures = [
     'f8(u8)',
@@ -33,12 +34,28 @@ def func(value: np.uint64) -> np.float64:
     (<class 'numpy.float64'>, -0.375)
     """
     value = np.uint64(value)
-    m = np.int64(uint_to_twoscomp(
+
+    # Sign-extend the 40-bit mantissa and the 8-bit exponent with shifts and
+    # casts rather than a two's complement conversion
+    m = ((value & np.uint64(0xFFFFFF000000)) >> np.uint8(8)) + (
+        value & np.uint64(0x00000000FFFF)
+    )
+    m = np.int64(m << np.uint8(24)) >> np.int64(24)
+    e = np.int32(np.int8(np.uint8((value >> np.uint8(16)) & np.uint64(0xFF))))
+
+    M = np.float64(m) / np.float64(2**39)
+    return np.float64(M * pow2(e))
+
+
+def reference_func(value: np.uint64) -> np.float64:
+    """The original implementation of `func`, kept to test it against."""
+    value = np.uint64(value)
+    m = np.int64(twoscomp.jfunc(
         ((value & np.uint64(0xFFFFFF000000)) >> np.uint8(8))
         + (value & np.uint64(0x00000000FFFF)),
         np.uint8(40)
     ))
-    e = np.int8(uint_to_twoscomp(
+    e = np.int8(twoscomp.jfunc(
         (value & np.uint64(0x000000FF0000)) >> np.uint8(16), np.uint8(8)
     ))
     M = np.float64(m) / np.float64(2**39)
@@ -46,5 +63,4 @@ def func(value: np.uint64) -> np.float64:
     return np.float64(M * 2 ** E)
 
 
-jfunc = njit(signatures)(func)
-ufunc = vectorize(signatures)(func)
+__getattr__ = lazy_kernels(__name__, func, signatures)
@@ -1,5 +1,5 @@
 import numpy as np
-from numba import njit, vectorize
+from ._lazy import lazy_kernels
 from .typing import UnsignedInteger, SignedInteger
 
 signatures = [
@@ -33,12 +33,20 @@ def func(value: UnsignedInteger, size: np.uint8) -> SignedInteger:
     >>> type(out), out
     (<class 'numpy.int64'>, -1)
     """
+    # A negative one's complement value is one more than the same bits
+    # in two's complement
+    pad_bits = np.uint8(64 - size)
+    out = np.int64(np.uint64(value) << pad_bits) >> pad_bits
+    return out + np.int64(out < 0)
+
+
+def reference_func(value: UnsignedInteger, size: np.uint8) -> SignedInteger:
+    """The original implementation of `func`, kept to test it against."""
     value = np.uint64(value)
     pad_bits = np.uint8(64 - size)
     if value & (np.uint64(1) << np.uint8(size - 1)) != 0:
         return -np.int64((~(value << pad_bits)) >> pad_bits)
-    return value
+    return np.int64(value)
 
 
-jfunc = njit(signatures)(func)
-ufunc = vectorize(signatures)(func)
+__getattr__ = lazy_kernels(__name__, func, signatures)
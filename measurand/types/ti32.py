@@ -1,6 +1,7 @@
 import numpy as np
-from numba import njit, vectorize
-from .twoscomp import jfunc as uint_to_twoscomp
+from ._bits import pow2
+from ._lazy import lazy_kernels
+from . import twoscomp
 
 signatures = [
     'f8(u4)',
@@ -33,7 +34,26 @@ def func(value: np.uint32) -> np.float64:
     # https://www.ti.com/lit/an/spra400/spra400.pdf
     value = np.uint32(value)
 
-    e = uint_to_twoscomp(
+    e = np.int32(np.int8(np.uint8(value >> np.uint8(24))))
+    s = (value & np.uint32(0x00800000)) >> np.uint8(23)
+    m = value & np.uint32(0x007FFFFF)
+
+    # (-2) ** s, without a power
+    S = np.float64(1) - np.float64(3) * np.float64(s)
+    M = np.float64(m)
+    x = (S + M / np.float64(2**23)) * pow2(e)
+
+    # The most negative exponent encodes zero
+    return np.float64(0) if e == np.int32(-128) else x
+
+
+def reference_func(value: np.uint32) -> np.float64:
+    """The original implementation of `func`, kept to test it against."""
+    # Reference:
+    # https://www.ti.com/lit/an/spra400/spra400.pdf
+    value = np.uint32(value)
+
+    e = twoscomp.jfunc(
         (value & np.uint32(0xFF000000)) >> np.uint8(24), np.uint8(8)
     )
     s = (value & np.uint32(0x00800000)) >> np.uint8(23)
@@ -49,5 +69,4 @@ def func(value: np.uint32) -> np.float64:
     return (S + M/np.float64(2**23)) * np.float64(2) ** E
 
 
-jfunc = njit(signatures)(func)
-ufunc = vectorize(signatures)(func)
+__getattr__ = lazy_kernels(__name__, func, signatures)
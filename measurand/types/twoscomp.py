@@ -1,5 +1,5 @@
 import numpy as np
-from numba import njit, vectorize
+from ._lazy import lazy_kernels
 from .typing import UnsignedInteger, SignedInteger
 
 signatures = [
@@ -33,12 +33,18 @@ def func(value: UnsignedInteger, size: np.uint8) -> SignedInteger:
     >>> type(out), out
     (<class 'numpy.int64'>, -1)
     """
+    # Shift the sign bit to the top and back, which sign-extends the value
+    pad_bits = np.uint8(64 - size)
+    return np.int64(np.uint64(value) << pad_bits) >> pad_bits
+
+
+def reference_func(value: UnsignedInteger, size: np.uint8) -> SignedInteger:
+    """The original implementation of `func`, kept to test it against."""
     value = np.uint64(value)
     if value >= 2**(size-1):
         pad_bits = np.uint8(64 - size)
-        value = np.int64(np.uint64(value) << pad_bits) >> pad_bits
-    return value
+        return np.int64(np.uint64(value) << pad_bits) >> pad_bits
+    return np.int64(value)
 
 
-jfunc = njit(signatures)(func)
-ufunc = vectorize(signatures)(func)
+__getattr__ = lazy_kernels(__name__, func, signatures)
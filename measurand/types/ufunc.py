@@ -1,12 +1,18 @@
-from .onescomp import ufunc as onescomp
-from .twoscomp import ufunc as twoscomp
-from .bcd import ufunc as bcd
-from .dec32 import ufunc as dec32
-from .dec64 import ufunc as dec64
-from .dec64g import ufunc as dec64g
-from .ibm32 import ufunc as ibm32
-from .ibm64 import ufunc as ibm64
-from .milstd1750a32 import ufunc as milstd1750a32
-from .milstd1750a48 import ufunc as milstd1750a48
-from .ti32 import ufunc as ti32
-from .ti40 import ufunc as ti40
+from ._lazy import lazy_aggregate
+
+__all__ = [
+    "onescomp",
+    "twoscomp",
+    "bcd",
+    "dec32",
+    "dec64",
+    "dec64g",
+    "ibm32",
+    "ibm64",
+    "milstd1750a32",
+    "milstd1750a48",
+    "ti32",
+    "ti40",
+]
+
+__getattr__ = lazy_aggregate(__name__, "ufunc", __all__)
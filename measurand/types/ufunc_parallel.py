@@ -0,0 +1,18 @@
+from ._lazy import lazy_aggregate
+
+__all__ = [
+    "onescomp",
+    "twoscomp",
+    "bcd",
+    "dec32",
+    "dec64",
+    "dec64g",
+    "ibm32",
+    "ibm64",
+    "milstd1750a32",
+    "milstd1750a48",
+    "ti32",
+    "ti40",
+]
+
+__getattr__ = lazy_aggregate(__name__, "ufunc_parallel", __all__)
@@ -1,9 +1,10 @@
+import functools
 import re
-from typing import List, Tuple
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pyarrow as pa
-import pyarrow.compute as pac
+from numba import njit
 from numpy.typing import DTypeLike
 
 
@@ -59,38 +60,178 @@ def _bit_range_to_mask_and_shift(lsb: int, msb: int) -> int:
     return mask, shift
 
 
+# Each possible byte with the order of its bits reversed
+_REVERSED_BYTES = np.array([int(f"{i:08b}"[::-1], 2) for i in range(256)], np.uint8)
+
+
 def _reverse_bits_ndarray(x: np.ndarray, size: int) -> np.ndarray:
+    # Reverse the bits within each byte with a table lookup, then reverse the
+    # order of the bytes within each value. Neither step depends on the byte
+    # order of `x`.
     tmp = np.ascontiguousarray(x)
-    dtype = x.dtype
-    result = np.flip(
-        np.ascontiguousarray(
-            np.packbits(np.flip(np.unpackbits(tmp.view(np.uint8))))
-        ).view(dtype)
-    )
+    result = _REVERSED_BYTES[tmp.view(np.uint8)].view(tmp.dtype)
+    if tmp.dtype.itemsize > 1:
+        result = result.byteswap(inplace=True)
     shift = result.dtype.itemsize * 8 - size
     if shift:
         result = np.right_shift(result, np.uint8(shift))
     return result
 
 
-ONE = np.uint8(1)
+@njit(nogil=True)
+def _reverse_bits_scalar(value: np.uint64, size: int) -> np.uint64:
+    value = np.uint64(value)
+    result = np.uint64(0)
+    for _ in range(8):
+        result = (result << np.uint64(8)) | _REVERSED_BYTES[value & np.uint64(0xFF)]
+        value = value >> np.uint64(8)
+    return result >> np.uint64(64 - size)
+
+
+@njit(nogil=True)
+def _reverse_bits_numba(x: np.ndarray, size: int) -> np.ndarray:
+    result = np.empty_like(x)
+    for i in range(x.shape[0]):
+        result[i] = _reverse_bits_scalar(x[i], size)
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _arrow_to_numpy_dtype(arrow_type: pa.DataType) -> np.dtype:
+    return pa.array([], type=arrow_type).to_numpy().dtype
+
+
+def _ndarray_view(arr: pa.Array) -> np.ndarray:
+    # A zero-copy view of the values of a fixed-width Arrow array. The values
+    # behind null slots are undefined.
+    dtype = _arrow_to_numpy_dtype(arr.type)
+    return np.frombuffer(
+        arr.buffers()[1],
+        dtype=dtype,
+        count=len(arr),
+        offset=arr.offset * dtype.itemsize,
+    )
+
+
+def _validity_buffer(arr: pa.Array) -> Optional[pa.Buffer]:
+    # The validity bitmap of `arr`, starting at its first element
+    if not arr.null_count:
+        return None
+    if not arr.offset:
+        return arr.buffers()[0]
+    return arr.is_valid().buffers()[1]
+
+
+def _map_paarray(
+    arr: Union[pa.Array, pa.ChunkedArray], func: Callable[[np.ndarray], np.ndarray]
+) -> Union[pa.Array, pa.ChunkedArray]:
+    # Apply a NumPy function to the values of each chunk of `arr` in a single
+    # pass, preserving its validity bitmap and chunking
+    if isinstance(arr, pa.ChunkedArray):
+        if not arr.num_chunks:
+            empty = func(np.empty(0, dtype=_arrow_to_numpy_dtype(arr.type)))
+            return pa.chunked_array([], type=pa.from_numpy_dtype(empty.dtype))
+        return pa.chunked_array([_map_paarray(c, func) for c in arr.chunks])
+
+    values = func(_ndarray_view(arr))
+    values = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("="))
+    return pa.Array.from_buffers(
+        pa.from_numpy_dtype(values.dtype),
+        len(arr),
+        [_validity_buffer(arr), pa.py_buffer(values)],
+        null_count=arr.null_count,
+    )
+
+
+def _row_mask(data: np.ndarray, words: Sequence[int]) -> np.ndarray:
+    # The rows of a masked 2-D array where any of `words` is masked
+    mask = np.ma.getmask(data)
+    if mask is np.ma.nomask:
+        return np.ma.nomask
+    return mask[:, list(words)].any(axis=1)
+
+
+def _and_validity(arrays: Sequence[pa.Array]) -> Optional[pa.Buffer]:
+    # The validity bitmap of rows that are valid in every one of `arrays`, all
+    # of the same length, combined a byte at a time
+    bitmaps = [b for b in map(_validity_buffer, arrays) if b is not None]
+    if len(bitmaps) <= 1:
+        return bitmaps[0] if bitmaps else None
+    nbytes = (len(arrays[0]) + 7) // 8
+    result = np.frombuffer(bitmaps[0], dtype=np.uint8, count=nbytes).copy()
+    for bitmap in bitmaps[1:]:
+        np.bitwise_and(
+            result, np.frombuffer(bitmap, dtype=np.uint8, count=nbytes), out=result
+        )
+    return pa.py_buffer(result)
+
+
+def _map_columns(
+    table: pa.Table,
+    columns: Sequence[int],
+    func: Callable[[List[np.ndarray]], np.ndarray],
+) -> pa.ChunkedArray:
+    # Apply a NumPy function to zero-copy views of `columns` of each record
+    # batch of `table`, giving one chunk per batch. A row is null where any of
+    # its columns is null.
+    table = table.select(list(columns))
+    chunks = []
+    for batch in table.to_batches():
+        values = func([_ndarray_view(arr) for arr in batch.columns])
+        values = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("="))
+        chunks.append(
+            pa.Array.from_buffers(
+                pa.from_numpy_dtype(values.dtype),
+                len(batch),
+                [_and_validity(batch.columns), pa.py_buffer(values)],
+            )
+        )
+
+    if not chunks:
+        empty = func([np.empty(0, _arrow_to_numpy_dtype(f.type)) for f in table.schema])
+        return pa.chunked_array([], type=pa.from_numpy_dtype(empty.dtype))
+    return pa.chunked_array(chunks)
 
 
 def _reverse_bits_paarray(arr: pa.Array, size: int) -> pa.Array:
     dtype = _size_to_uint(size)
-    if isinstance(arr, pa.ChunkedArray):
-        result = pa.chunked_array(
-            [np.zeros(len(chunk), dtype=dtype) for chunk in arr.chunks]
+    return _map_paarray(
+        arr, lambda x: _reverse_bits_numba(x, size).astype(dtype, copy=False)
+    )
+
+
+def _extract_bits(data: np.ndarray, offsets: np.ndarray, size: int) -> np.ndarray:
+    # Extract the `size`-bit fields starting at each of the bit `offsets` into
+    # the rows of `data`, a 2-D array of bytes holding a big-endian bitstream
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if size > 64:
+        raise ValueError(f"fields of {size} bits cannot be extracted")
+    if len(offsets) and (offsets.min() < 0 or offsets.max() + size > data.shape[1] * 8):
+        raise IndexError(f"{size}-bit field past the end of a row")
+
+    nbytes = (size + 14) // 8
+    if nbytes > 8:
+        # An unaligned field of more than 57 bits spans 9 bytes, more than a
+        # uint64 holds, so it is read as two halves
+        low = size // 2
+        result = _extract_bits(data, offsets, size - low)
+        np.left_shift(result, np.uint64(low), out=result)
+        np.bitwise_or(
+            result, _extract_bits(data, offsets + size - low, low), out=result
         )
-    else:
-        result = pa.array(np.zeros(len(arr), dtype=dtype))
-
-    for i in range(size):
-        digit = pac.bit_wise_and(arr, ONE)
-        result = pac.add(result, digit)
-        if i < size - 1:
-            result = pac.shift_left(result, ONE)
-            arr = pac.shift_right(arr, ONE)
+        return result
+
+    # The field is within the row, so bytes past its end only ever land below
+    # the field, where they are shifted out, and clipping their index is harmless
+    index = np.minimum(offsets[:, None] // 8 + np.arange(nbytes), data.shape[1] - 1)
+    result = np.zeros((data.shape[0], len(offsets)), dtype=np.uint64)
+    for i in range(nbytes):
+        np.left_shift(result, np.uint64(8), out=result)
+        np.bitwise_or(result, data[:, index[:, i]], out=result)
+
+    shift = (nbytes * 8 - offsets % 8 - size).astype(np.uint64)
+    np.right_shift(result, shift, out=result)
+    np.bitwise_and(result, np.uint64((1 << size) - 1), out=result)
     return result
 
 
@@ -1,5 +1,6 @@
 import numpy as np
 import pyarrow as pa
+import pytest
 
 from measurand.utils import _size_to_uint
 
@@ -27,3 +28,22 @@ SAMPLE_PAARRAY = {
     word_size: numpy_2d_array_to_arrow_table(SAMPLE_NDARRAY[word_size])
     for word_size in [8, 10, 12]
 }
+
+
+# Random 8-byte frames and a mix of specs over them, shared by the tests of
+# the chunked, threaded and batch builds
+FRAMES = np.random.default_rng(0).integers(0, 256, (1000, 8), dtype="u1")
+FRAMES.flags.writeable = False
+
+FRAME_SPECS = {
+    "a": "1-2;2c",
+    "b": "3:1-4R+4;u;EUC[0.5,2]",
+    "c": "5-8;ti32",
+    "d": "1-4;ieee32",
+    "e": "1;u",
+}
+
+
+@pytest.fixture
+def frames() -> np.ndarray:
+    return FRAMES
@@ -0,0 +1,86 @@
+import pickle
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from measurand.batch import build_files
+from measurand.measurand_set import MeasurandSet, make_measurand_set
+from measurand.reader import FrameFile
+from measurand.sampling import Sampling
+
+from .conftest import FRAME_SPECS, FRAMES
+
+
+def _frame_files(tmp_path, count=3):
+    data, files = [], []
+    for i in range(count):
+        frames = FRAMES[i:]
+        path = tmp_path / f"rec{i}.bin"
+        path.write_bytes(frames.tobytes())
+        data.append(frames)
+        files.append(FrameFile(path=path, frame_length=8))
+    return data, files
+
+
+def _read(path) -> pa.Table:
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+@pytest.mark.parametrize("chunk_rows", [64, 1 << 20])
+def test_build_files(tmp_path, chunk_rows):
+    data, files = _frame_files(tmp_path)
+    outputs = build_files(
+        FRAME_SPECS, files, tmp_path / "out", workers=2, chunk_rows=chunk_rows
+    )
+    assert outputs == [tmp_path / "out" / f"rec{i}.arrow" for i in range(3)]
+
+    ms = make_measurand_set(FRAME_SPECS)
+    for frames, output in zip(data, outputs):
+        table = _read(output)
+        assert table.column_names == list(FRAME_SPECS)
+        expected = ms.build(frames)
+        for name in FRAME_SPECS:
+            result = table.column(name).to_numpy()
+            assert result.dtype == expected[name].dtype.newbyteorder("=")
+            np.testing.assert_array_equal(result, expected[name])
+
+
+def test_build_files_outputs(tmp_path):
+    data, files = _frame_files(tmp_path, count=2)
+    outputs = [tmp_path / "x.arrow", tmp_path / "y.arrow"]
+    ms = make_measurand_set(FRAME_SPECS)
+    assert build_files(ms, files, outputs, workers=1) == outputs
+    assert _read(outputs[1]).num_rows == len(data[1])
+
+    with pytest.raises(ValueError):
+        build_files(ms, files, outputs[:1])
+    with pytest.raises(ValueError):
+        build_files(ms, files, [outputs[0], outputs[0]])
+
+    # The columns of an output cannot have different lengths
+    m = ms.measurands["a"]
+    sampled = m.model_copy(update={"sampling": Sampling(window=4, mode="max")})
+    mixed = MeasurandSet(measurands={"a": m, "b": sampled})
+    with pytest.raises(ValueError, match="sampling windows"):
+        build_files(mixed, files, outputs)
+
+
+def test_build_files_empty(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    (output,) = build_files(
+        FRAME_SPECS, [FrameFile(path=path, frame_length=8)], tmp_path
+    )
+    table = _read(output)
+    assert table.num_rows == 0
+    assert table.column_names == list(FRAME_SPECS)
+
+
+def test_frame_file_pickle(tmp_path):
+    _, (file, *_) = _frame_files(tmp_path, count=1)
+    assert len(file) == 1000
+    state = pickle.dumps(file)
+    assert len(state) < 1000
+    np.testing.assert_array_equal(pickle.loads(state).read(), file.read())
@@ -0,0 +1,94 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from measurand.measurand import make_measurand
+from measurand.measurand_set import MeasurandSet
+from measurand.sampling import Sampling
+from measurand.utils import _numpy_2d_array_to_arrow_table
+
+from .conftest import FRAME_SPECS
+
+
+@pytest.mark.parametrize("spec", list(FRAME_SPECS.values()))
+@pytest.mark.parametrize("fused", [False, True])
+@pytest.mark.parametrize("chunk_rows", [1, 7, 100, 1000, 5000])
+def test_build_threaded_ndarray(spec, fused, chunk_rows, frames):
+    m = make_measurand(spec).model_copy(update={"fused": fused})
+    result = m.build_threaded(frames, workers=4, chunk_rows=chunk_rows)
+    expected = m.build(frames)
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("fused", [False, True])
+@pytest.mark.parametrize("sampling", [None, Sampling(window=4, mode="mode")])
+def test_build_threaded_masked(fused, sampling, frames):
+    data = np.ma.MaskedArray(
+        frames, mask=np.random.default_rng(1).random(frames.shape) < 0.1
+    )
+    m = make_measurand("1-2;2c").model_copy(
+        update={"fused": fused, "sampling": sampling}
+    )
+    result = m.build_threaded(data, workers=4, chunk_rows=100)
+    expected = m.build(data)
+    assert np.ma.getmaskarray(result).tolist() == np.ma.getmaskarray(expected).tolist()
+    np.testing.assert_array_equal(result.data, expected.data)
+
+
+@pytest.mark.parametrize("spec", list(FRAME_SPECS.values()))
+@pytest.mark.parametrize("chunk_rows", [7, 100, 5000])
+def test_build_threaded_paarray(spec, chunk_rows, frames):
+    m = make_measurand(spec)
+    table = _numpy_2d_array_to_arrow_table(frames)
+    result = m.build_threaded(table, workers=4, chunk_rows=chunk_rows)
+    expected = m.build(table)
+    assert result.type == expected.type
+    assert result.to_pylist() == pytest.approx(expected.to_pylist(), nan_ok=True)
+
+
+@pytest.mark.parametrize("fused", [False, True])
+@pytest.mark.parametrize("chunk_rows", [1, 7, 64, 1000])
+@pytest.mark.parametrize("mode", ["mean", "mode", "max", "min"])
+def test_build_threaded_sampling(fused, chunk_rows, mode, frames):
+    m = make_measurand("1-2;2c;EUC[2]")
+    m = m.model_copy(
+        update={"sampling": Sampling(window=16, mode=mode), "fused": fused}
+    )
+    result = m.build_threaded(frames, workers=4, chunk_rows=chunk_rows)
+    np.testing.assert_array_equal(result, m.build(frames))
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 50, 1000])
+def test_measurand_set_build_threaded(chunk_rows, frames):
+    m = make_measurand("1-2;u")
+    ms = MeasurandSet(
+        measurands={
+            "a": m,
+            "b": m.model_copy(update={"sampling": Sampling(window=4, mode="min")}),
+            "c": make_measurand("3-4;2c;EUC[0.5]"),
+        }
+    )
+    result = ms.build_threaded(frames, workers=3, chunk_rows=chunk_rows)
+    expected = ms.build(frames)
+    assert result.keys() == expected.keys()
+    for name in expected:
+        assert result[name].dtype == expected[name].dtype
+        np.testing.assert_array_equal(result[name], expected[name])
+
+    table = _numpy_2d_array_to_arrow_table(frames)
+    with pytest.raises(ValueError, match="sampling windows"):
+        ms.build_threaded(table, workers=3, chunk_rows=chunk_rows)
+
+    ms = MeasurandSet(measurands={"a": m, "c": ms.measurands["c"]})
+    result = ms.build_threaded(table, workers=3, chunk_rows=chunk_rows)
+    assert isinstance(result, pa.Table)
+    assert result.equals(ms.build(table))
+
+
+def test_build_threaded_serial(frames):
+    m = make_measurand("1-2;2c")
+    np.testing.assert_array_equal(
+        m.build_threaded(frames, workers=1, chunk_rows=10), m.build(frames)
+    )
+    np.testing.assert_array_equal(m.build_threaded(frames[:0]), m.build(frames[:0]))
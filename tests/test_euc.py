@@ -1,10 +1,23 @@
+import math
+import pickle
+from decimal import Decimal
+
 import numpy as np
 import pyarrow as pa
 import pytest
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
-from measurand.euc import RE_SCALEFACTOR, ScaleFactorEUC, make_euc
+from measurand.euc import (
+    RE_SCALEFACTOR,
+    ExpressionEUC,
+    FunctionEUC,
+    PiecewiseLinearEUC,
+    PolynomialEUC,
+    ScaleFactorEUC,
+    make_euc,
+)
+from measurand.measurand import make_measurand
 
 from . import strategies as cst
 from .conftest import ARRAY_SIZE
@@ -62,6 +75,184 @@ def test_euc_apply_paarray(val: int, db: float, sf: float, sb: float):
     assert result.to_pylist() == pytest.approx([answer] * ARRAY_SIZE)
 
 
+@pytest.mark.parametrize(
+    "input_dtype, dtype, output_dtype",
+    [
+        ("u1", None, "f8"),
+        (">u4", None, "f8"),
+        (">f4", None, "f4"),
+        (">f8", None, "f8"),
+        ("u2", "float32", "f4"),
+        (">f8", "float32", "f4"),
+        ("f4", "float64", "f8"),
+    ],
+)
+def test_euc_dtype(input_dtype, dtype, output_dtype):
+    euc = ScaleFactorEUC(data_bias=1, scale_factor=0.5, scaled_bias=-2, dtype=dtype)
+    data = np.arange(ARRAY_SIZE, dtype=input_dtype)
+    original = data.copy()
+
+    result = euc.apply_ndarray(data, 8)
+    assert result.dtype == np.dtype(output_dtype)
+    assert result.dtype.isnative
+    np.testing.assert_allclose(result, (original.astype("f8") + 1) * 0.5 - 2)
+    np.testing.assert_array_equal(data, original)
+
+    result = euc.apply_paarray(pa.array(data.astype(input_dtype[-2:])), 8)
+    assert result.type == pa.from_numpy_dtype(np.dtype(output_dtype))
+
+
 def test_scale_factor_invalid():
     with pytest.raises(ValueError):
         make_euc("not a valid scale factor")
+
+
+@pytest.mark.parametrize(
+    "spec, result",
+    [
+        ("POLY[2]", PolynomialEUC(coefficients=[2])),
+        ("poly[1,-0.5,2^-3]", PolynomialEUC(coefficients=[1, -0.5, 0.125])),
+        ("TABLE[0:-1,10:1]", PiecewiseLinearEUC(x=[0, 10], y=[-1, 1])),
+        ("table[0:0, 1:2, 3:3]", PiecewiseLinearEUC(x=[0, 1, 3], y=[0, 2, 3])),
+    ],
+)
+def test_make_euc_calibration(spec, result):
+    assert make_euc(spec) == result
+
+
+@pytest.mark.parametrize(
+    "spec", ["POLY[]", "TABLE[1:1]", "TABLE[0:0,0:1]", "TABLE[1:0,0:1]", "TABLE[0,1]"]
+)
+def test_make_euc_calibration_invalid(spec):
+    with pytest.raises(ValueError):
+        make_euc(spec)
+
+
+def test_make_euc_calibration_precision():
+    # Coefficients and breakpoints are not rounded to float32
+    euc = make_euc("POLY[0.1,1.0000001,1e-9,2^-30]")
+    assert euc.coefficients == (0.1, 1.0000001, 1e-9, 2**-30)
+    euc = make_euc("TABLE[16777216:1,16777217:2]")
+    assert euc.x == (16777216.0, 16777217.0)
+    assert euc.apply_ndarray(np.array([16777216.5]), 64).tolist() == [1.5]
+
+    data = np.arange(ARRAY_SIZE, dtype="u1").reshape(-1, 1)
+    spec = "1;u;POLY[0.1,1.0000001]"
+    expected = 0.1 + 1.0000001 * data[:, 0].astype("f8")
+    for fused in (False, True):
+        result = make_measurand(spec, fused=fused).build(data)
+        assert result.tolist() == expected.tolist()
+
+
+@settings(deadline=None)
+@given(st.lists(cst.euc_float(), min_size=1, max_size=6))
+def test_polynomial_euc(coefficients):
+    euc = PolynomialEUC(coefficients=coefficients)
+    data = np.arange(ARRAY_SIZE, dtype="u1")
+    expected = np.polynomial.polynomial.polyval(data, euc.coefficients)
+    np.testing.assert_allclose(euc.apply_ndarray(data, 8), expected)
+
+    arr = pa.chunked_array([pa.array(data[:10]), pa.array([None, 4], pa.uint8())])
+    result = euc.apply_paarray(arr, 8).to_pylist()
+    assert result[:10] == pytest.approx(expected[:10].tolist())
+    assert result[10:] == [None, pytest.approx(expected[4])]
+
+
+def test_piecewise_linear_euc():
+    euc = PiecewiseLinearEUC(x=[0, 10, 20], y=[0, 100, 150])
+    data = np.array([-5, 0, 5, 10, 15, 20, 30], dtype="i1")
+    expected = [-50, 0, 50, 100, 125, 150, 200]
+    assert euc.apply_ndarray(data, 8).tolist() == expected
+
+    interior = np.linspace(0, 20, ARRAY_SIZE)
+    result = euc.apply_ndarray(interior, 8)
+    np.testing.assert_allclose(result, np.interp(interior, euc.x, euc.y))
+
+    arr = pa.chunked_array([pa.array(data[:3]), pa.array([None, 15], pa.int8())])
+    assert euc.apply_paarray(arr, 8).to_pylist() == [-50, 0, 50, None, 125]
+
+
+@pytest.mark.parametrize("spec", ["PV * 2 + 1", "pv*2+1", "(PV + 0.5) * 2"])
+def test_make_euc_expression(spec):
+    assert make_euc(spec) == ExpressionEUC(expression=spec)
+
+
+def test_make_euc_expression_overflow():
+    # Constant subexpressions are checked when the EUC is made, not built
+    with pytest.raises(ValueError):
+        make_euc("PV + 9^9^9")
+
+
+@pytest.mark.parametrize("spec", ["PV + os.system", "__import__('os') * PV"])
+def test_make_euc_expression_invalid(spec):
+    with pytest.raises(ValueError):
+        make_euc(spec)
+
+
+@pytest.mark.parametrize("jit", [False, True])
+@pytest.mark.parametrize(
+    "expression, func",
+    [
+        ("PV^2 * 1e-3 + sqrt(PV) - 4", lambda x: x**2 * 1e-3 + np.sqrt(x) - 4),
+        ("log10(PV + 1) * pi", lambda x: np.log10(x + 1) * np.pi),
+        ("2.5", lambda x: np.full(x.shape, 2.5)),
+    ],
+)
+def test_expression_euc(expression, func, jit):
+    euc = ExpressionEUC(expression=expression, jit=jit)
+    data = np.arange(ARRAY_SIZE, dtype="u1")
+    result = euc.apply_ndarray(data, 8)
+    assert result.dtype == np.float64
+    np.testing.assert_allclose(result, func(data.astype("f8")))
+
+    arr = pa.chunked_array([pa.array(data[:10]), pa.array([None, 4], pa.uint8())])
+    expected = func(np.array([*data[:10], 0, 4], dtype="f8")).tolist()
+    assert euc.apply_paarray(arr, 8).to_pylist() == pytest.approx(
+        expected[:10] + [None, expected[11]]
+    )
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_expression_euc_pickle(jit):
+    euc = ExpressionEUC(expression="PV * 2 + 1", jit=jit)
+    data = np.arange(ARRAY_SIZE, dtype="u1")
+    expected = euc.apply_ndarray(data, 8)
+    result = pickle.loads(pickle.dumps(euc))
+    assert result == euc
+    np.testing.assert_array_equal(result.apply_ndarray(data, 8), expected)
+
+
+def test_scale_factor_expression():
+    assert make_euc("EUC[2^-3,1/4]") == ScaleFactorEUC(
+        data_bias=0.125, scale_factor=0.25
+    )
+    with pytest.raises(ValueError):
+        make_euc("EUC[__import__('os')]")
+
+
+def _not_jittable(value: float) -> float:
+    return float(Decimal(value) * 2)
+
+
+@pytest.mark.parametrize(
+    "func, compiled",
+    [
+        (lambda x: 2 * x + 1, True),
+        (np.sqrt, True),
+        (math.sqrt, True),
+        (abs, True),
+        (_not_jittable, False),
+    ],
+)
+def test_function_euc(func, compiled):
+    euc = FunctionEUC(func=func)
+    assert isinstance(euc.vectorized_func, np.vectorize) is not compiled
+
+    data = np.arange(ARRAY_SIZE, dtype="u1")
+    expected = [float(func(float(x))) for x in data]
+    assert euc.apply_ndarray(data, 8).tolist() == pytest.approx(expected)
+
+    arr = pa.chunked_array([pa.array(data[:10]), pa.array([None, 4], pa.uint8())])
+    result = euc.apply_paarray(arr, 8)
+    assert result.type == pa.float64()
+    assert result.to_pylist() == pytest.approx(expected[:10] + [None, func(4.0)])
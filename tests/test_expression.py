@@ -0,0 +1,81 @@
+import ast
+
+import numpy as np
+import pytest
+
+from measurand.expression import compile_expression, evaluate_constant, parse
+
+
+@pytest.mark.parametrize(
+    "source, result",
+    [
+        ("2", 2.0),
+        ("2^-3", 0.125),
+        ("2**-3", 0.125),
+        ("-1.5e-3 * 4", -0.006),
+        ("7 // 2 + 7 % 2", 4.0),
+        ("sqrt(16) + log10(100)", 6.0),
+        ("cos(pi)", -1.0),
+    ],
+)
+def test_evaluate_constant(source, result):
+    assert evaluate_constant(source) == pytest.approx(result)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "",
+        "PV",
+        "1 +",
+        "9^9^9",
+        "1 / 0",
+        "__import__('os')",
+        "open('file')",
+        "(1).__class__",
+        "[1, 2]",
+        "1 if 1 else 2",
+        "1 < 2",
+        "True",
+        "'a'",
+        "sqrt(1, 2)",
+        "sqrt(x=1)",
+        "np.sqrt(4)",
+        "lambda: 1",
+    ],
+)
+def test_evaluate_constant_invalid(source):
+    with pytest.raises(ValueError):
+        evaluate_constant(source)
+
+
+@pytest.mark.parametrize("source", ["PV", "pv", "Pv"])
+def test_variable_case(source):
+    assert compile_expression(source)(3.0) == 3.0
+
+
+@pytest.mark.parametrize("source", ["PV + 9^9^9", "PV * (1 / 0)", "PV + (-8)^0.5"])
+def test_compile_expression_invalid_constants(source):
+    with pytest.raises(ValueError):
+        compile_expression(source)
+
+
+def test_parse_folds_constants():
+    tree = parse("PV * (2 + sqrt(9)) - pi")
+    assert isinstance(tree.body.right, ast.Constant)
+    assert tree.body.right.value == np.pi
+    assert isinstance(tree.body.left.right, ast.Constant)
+    assert tree.body.left.right.value == 5.0
+
+
+def test_parse_rejects_other_names():
+    with pytest.raises(ValueError):
+        parse("PV + x")
+
+
+def test_compile_expression_ndarray():
+    func = compile_expression("PV^2 * 0.5 - abs(PV - 10) + exp(0)")
+    data = np.linspace(-20, 20, 101)
+    expected = data**2 * 0.5 - np.abs(data - 10) + 1
+    np.testing.assert_allclose(func(data), expected)
+    assert func(2.0) == pytest.approx(-5.0)
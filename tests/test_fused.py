@@ -0,0 +1,170 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from measurand.euc import ScaleFactorEUC
+from measurand.fused import KernelCache, compile_measurand
+from measurand.measurand import make_measurand
+from measurand.utils import _numpy_2d_array_to_arrow_table
+
+from .cases import Example, parameter_test_cases
+from .conftest import ARRAY_SIZE, SAMPLE_NDARRAY
+
+
+@pytest.mark.parametrize("case", parameter_test_cases)
+def test_fused_parameter(case: Example):
+    m = make_measurand(
+        case.spec, word_size=case.word_size, one_based=case.one_based, fused=True
+    )
+    out = m.build(SAMPLE_NDARRAY[case.word_size])
+    assert list(out) == [case.result] * ARRAY_SIZE
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "1;u",
+        "1:1-3;1c",
+        "1:1-3;2c;EUC[2]",
+        "1-2;2c;EUC[0.5,0.1,-3]",
+        "1-2R;1c",
+        "1:2-7R+2+3:1-4",
+        "1-4;ieee32",
+        "1-4;ieee32;EUC[1.5,2,3]",
+        "1-8;ieee64;EUC[0.25]",
+        "1-4;1750a32;EUC[1,2,3]",
+        "1-6;1750a48",
+        "1-4;ti32",
+        "1-5;ti40",
+        "1-4;ibm32",
+        "1-8;ibm64",
+        "1-4;dec32",
+        "1-8;dec64",
+        "1-8;dec64g",
+        "1-4;bcd",
+        "1-4;u;EUC[1,2,3]",
+        "1-2;2c;POLY[0.5,-2,1e-3]",
+        "1-4;ieee32;POLY[3]",
+    ],
+)
+def test_fused_matches_staged(spec):
+    data = np.random.default_rng(0).integers(0, 256, (10_000, 8), dtype="u1")
+    staged = make_measurand(spec)
+    fused = make_measurand(spec, fused=True)
+    expected = staged.build(data)
+    result = fused.build(data)
+    assert result.dtype == expected.dtype.newbyteorder("=")
+    np.testing.assert_array_equal(result, expected)
+
+    table = _numpy_2d_array_to_arrow_table(data)
+    expected = staged.build(table)
+    result = fused.build(table)
+    assert result.type == expected.type
+    np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+
+
+@pytest.mark.parametrize("spec", ["1-2;2c;EUC[2]", "2:1-4R+5;1c", "1-4;ieee32"])
+def test_fused_paarray_nulls(spec):
+    words = [[1, None, 3, 4], [5, 6, 7, None], [8, 9, 10, 11]]
+    table = pa.table(
+        {
+            str(i): pa.chunked_array([pa.array(w[:1], pa.uint8()), w[1:]], pa.uint8())
+            for i, w in enumerate(words + words[:2])
+        }
+    )
+    staged = make_measurand(spec)
+    fused = make_measurand(spec, fused=True)
+    expected = staged.build(table)
+    result = fused.build(table)
+    assert result.num_chunks == 2
+    assert result.type == expected.type
+    assert result.is_null().to_pylist() == expected.is_null().to_pylist()
+    assert result.to_pylist() == pytest.approx(expected.to_pylist(), nan_ok=True)
+
+
+@pytest.mark.parametrize("spec", ["1-2;2c", "3:1-4R+4;u;EUC[0.5,2]", "1-4;ieee32"])
+def test_fused_masked(spec):
+    data = np.ma.MaskedArray(
+        np.random.default_rng(0).integers(0, 256, (100, 4), dtype="u1"),
+        mask=np.random.default_rng(1).random((100, 4)) < 0.05,
+    )
+    expected = make_measurand(spec).build(data)
+    result = make_measurand(spec, fused=True).build(data)
+    assert isinstance(result, np.ma.MaskedArray)
+    assert result.dtype == expected.dtype.newbyteorder("=")
+    assert np.ma.getmaskarray(result).any()
+    assert np.ma.getmaskarray(result).tolist() == np.ma.getmaskarray(expected).tolist()
+    assert result.compressed().tolist() == pytest.approx(
+        expected.compressed().tolist(), nan_ok=True
+    )
+
+
+def test_fused_kernel_follows_copies():
+    data = np.array([[0, 1], [4, 5]], dtype="u1")
+    m = make_measurand("1-2;u;EUC[2]", fused=True)
+    assert m.build(data).tolist() == [2, 2058]
+
+    # The kernel of a copy, or of a changed model, is never the stale one
+    copy = m.model_copy(update={"euc": ScaleFactorEUC(scale_factor=3)})
+    assert copy.build(data).tolist() == [3, 3087]
+    m.euc = ScaleFactorEUC(scale_factor=4)
+    assert m.build(data).tolist() == [4, 4116]
+
+
+@pytest.mark.parametrize("spec", ["1-2;2c", "1-4;ieee32", "1-8;ieee64"])
+def test_fused_float32_euc(spec):
+    data = np.random.default_rng(0).integers(0, 256, (10_000, 8), dtype="u1")
+    euc = ScaleFactorEUC(data_bias=3, scale_factor=0.1, dtype="float32")
+    staged = make_measurand(spec).model_copy(update={"euc": euc})
+    fused = staged.model_copy(update={"fused": True})
+    expected = staged.build(data)
+    result = fused.build(data)
+    assert result.dtype == expected.dtype == np.float32
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_fused_output_buffer():
+    kernel = compile_measurand(make_measurand("1-2;2c;EUC[2]"))
+    out = np.empty(ARRAY_SIZE, dtype=kernel.output_dtype)
+    result = kernel(SAMPLE_NDARRAY[8], out=out)
+    assert result is out
+    assert out.tolist() == [0x0102 * 2] * ARRAY_SIZE
+
+
+@pytest.mark.parametrize("spec", ["1-2;ieee16", "1-2;u;TABLE[0:0,1:1]"])
+def test_fused_not_implemented(spec):
+    with pytest.raises(NotImplementedError):
+        compile_measurand(make_measurand(spec))
+
+
+def test_kernel_cache_shares_equivalent_specs():
+    cache = KernelCache()
+    k1 = cache.get(make_measurand("1-2;2c"))
+    k2 = cache.get(make_measurand("1+2;2c"))
+    k3 = cache.get(make_measurand("1+2;1c"))
+    assert k1 is k2
+    assert k1 is not k3
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_kernel_cache_lru():
+    cache = KernelCache(maxsize=2)
+    k1 = cache.get(make_measurand("1"))
+    cache.get(make_measurand("2"))
+    cache.get(make_measurand("1"))
+    cache.get(make_measurand("3"))
+    assert len(cache) == 2
+    assert cache.get(make_measurand("1")) is k1
+    cache.get(make_measurand("2"))
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_kernel_cache_dir(tmp_path):
+    m = make_measurand("1-4;ti32;EUC[1,2,3]")
+    k1 = KernelCache(cache_dir=str(tmp_path)).get(m)
+    k2 = KernelCache(cache_dir=str(tmp_path)).get(m)
+    assert k1.source == k2.source
+    assert len(list(tmp_path.glob("fused_*.py"))) == 1
+    data = SAMPLE_NDARRAY[8]
+    np.testing.assert_array_equal(k1(data), k2(data))
+    np.testing.assert_array_equal(k2(data), m.build(data))
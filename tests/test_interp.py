@@ -1,10 +1,16 @@
+import os
+import subprocess
+import sys
+
 import numpy as np
 import pyarrow as pa
 import pytest
-from hypothesis import assume, given
+from hypothesis import assume, given, settings
 from hypothesis import strategies as st
 
+from measurand import interp as interp_module
 from measurand.interp import (
+    BCD,
     IEEE16,
     IEEE32,
     IEEE64,
@@ -17,7 +23,11 @@ from measurand.interp import (
     OnesComplement,
     TwosComplement,
     Unsigned,
+    interp,
+    make_interp,
+    set_target,
 )
+from measurand.types import ufunc, ufunc_parallel
 from measurand.utils import _size_to_uint
 
 from . import strategies as cst
@@ -34,6 +44,7 @@ def test_unsigned(things):
 
 
 @given(cst.uint_and_size())
+@settings(deadline=None)
 def test_onescomp(things):
     uint, size = things
     dtype = _size_to_uint(size)
@@ -43,6 +54,7 @@ def test_onescomp(things):
 
 
 @given(cst.uint_and_size())
+@settings(deadline=None)
 def test_twoscomp(things):
     uint, size = things
     dtype = _size_to_uint(size)
@@ -73,6 +85,7 @@ def test_ieee64(uint):
 
 
 @given(cst.uint(32))
+@settings(deadline=None)
 def test_1750a32(uint):
     data = np.array([uint] * 10, dtype="u4")
     result = MilStd1750A32().apply_ndarray(data, 32)
@@ -80,6 +93,7 @@ def test_1750a32(uint):
 
 
 @given(cst.uint(48))
+@settings(deadline=None)
 def test_1750a48(uint):
     data = np.array([uint] * 10, dtype="u8")
     result = MilStd1750A48().apply_ndarray(data, 48)
@@ -87,6 +101,7 @@ def test_1750a48(uint):
 
 
 @given(cst.uint(32))
+@settings(deadline=None)
 def test_ti32(uint):
     data = np.array([uint] * 10, dtype="u4")
     result = TI32().apply_ndarray(data, 32)
@@ -94,6 +109,7 @@ def test_ti32(uint):
 
 
 @given(cst.uint(40))
+@settings(deadline=None)
 def test_ti40(uint):
     data = np.array([uint] * 10, dtype="u8")
     result = TI40().apply_ndarray(data, 40)
@@ -162,6 +178,13 @@ class FloatInterpTester:
         result = self.strategy.apply_paarray(data, self.size)
         assert result.to_pylist() == pytest.approx([value] * ARRAY_SIZE)
 
+    def test_paarray_nulls_and_chunks(self, uint, value):
+        chunk = pa.array(np.array([uint] * 3, dtype=self.dtype))
+        data = pa.chunked_array([chunk, pa.array([None, uint], chunk.type)])
+        result = self.strategy.apply_paarray(data, self.size)
+        assert [len(c) for c in result.chunks] == [3, 2]
+        assert result.to_pylist() == pytest.approx([value] * 3 + [None, value])
+
 
 @pytest.mark.parametrize(
     "uint, value",
@@ -206,6 +229,81 @@ class TestMilStd1750a48(FloatInterpTester):
     dtype = "u8"
 
 
+@pytest.mark.parametrize(
+    "strategy, size",
+    [
+        (OnesComplement(), 12),
+        (TwosComplement(), 12),
+        (IEEE16(), 16),
+        (IEEE32(), 32),
+        (IEEE64(), 64),
+        (TI32(), 32),
+        (TI40(), 40),
+    ],
+)
+def test_paarray_matches_ndarray(strategy: Interp, size: int):
+    values = np.random.default_rng(0).integers(0, 2**size, 100, dtype="u8")
+    values = values.astype(_size_to_uint(size))
+    expected = strategy.apply_ndarray(values, size)
+
+    valid = np.arange(100) % 7 != 0
+    data = pa.array(values, mask=~valid).slice(1)
+    result = strategy.apply_paarray(data, size)
+    assert result.is_valid().to_pylist() == valid[1:].tolist()
+    np.testing.assert_array_equal(result.drop_null(), expected[1:][valid[1:]])
+
+
+@pytest.mark.parametrize(
+    "uint, value",
+    [(0x0, 0), (0x9, 9), (0x10, 10), (0x1234, 1234), (0x9876543210, 9876543210)],
+)
+def test_bcd(uint, value):
+    data = np.array([uint] * ARRAY_SIZE, dtype="u8")
+    assert BCD().apply_ndarray(data, 40).tolist() == [value] * ARRAY_SIZE
+
+
+@pytest.mark.parametrize("spec", sorted(interp.registry))
+def test_parallel_target(spec):
+    cpu = make_interp(spec, target="cpu")
+    parallel = make_interp(spec, target="parallel")
+    size = cpu.SIZE or 16
+    data = np.random.default_rng(0).integers(0, 2**size, 1000, dtype="u8")
+    data = data.astype(_size_to_uint(size))
+    np.testing.assert_array_equal(
+        parallel.apply_ndarray(data, size), cpu.apply_ndarray(data, size)
+    )
+
+
+def test_set_target(monkeypatch):
+    monkeypatch.setattr(interp_module, "_target", "cpu")
+    strategy = TwosComplement()
+    assert strategy._ufunc("twoscomp") is ufunc.twoscomp
+    set_target("parallel")
+    assert strategy._ufunc("twoscomp") is ufunc_parallel.twoscomp
+    assert TwosComplement(target="cpu")._ufunc("twoscomp") is ufunc.twoscomp
+    with pytest.raises(ValueError):
+        set_target("cuda")
+
+
+@pytest.mark.parametrize("target", ["parallel", "paralel"])
+def test_target_environment_variable(target):
+    # The variable is read once, on import, so a fresh interpreter is needed
+    env = {
+        **os.environ,
+        "MEASURAND_TARGET": target,
+        "PYTHONPATH": os.pathsep.join(sys.path),
+    }
+    code = "from measurand import interp; print(interp._target)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+    if target == "parallel":
+        assert result.stdout.strip() == "parallel"
+    else:
+        assert result.returncode != 0
+        assert "ValueError: target 'paralel' not valid" in result.stderr
+
+
 ###################
 # Exception Tests #
 ###################
@@ -0,0 +1,98 @@
+import json
+
+import numpy as np
+import pytest
+
+from measurand.loader import (
+    load_measurand_set,
+    parse_specs,
+    read_specs,
+    save_measurand_set,
+)
+from measurand.measurand_set import make_measurand_set
+
+SPECS = {
+    "a": "1-2;2c",
+    "b": "3:1-4R+4;u;EUC[0.5,2]",
+    "c": "5-8;ti32",
+    "d": "1;u",
+    "e": "1-2;2c;EUC[2]",
+    "f": "3:1-4R+4;u",
+}
+DATA = np.random.default_rng(0).integers(0, 256, (100, 9), dtype="u1")
+
+
+def _assert_builds_like(ms, specs, word_size=8, one_based=True):
+    data = DATA.astype(f"u{word_size // 8}")
+    expected = make_measurand_set(specs, word_size=word_size, one_based=one_based)
+    expected = expected.build(data)
+    out = ms.build(data)
+    assert list(out) == list(expected)
+    for name, values in expected.items():
+        assert out[name].dtype == values.dtype
+        np.testing.assert_array_equal(out[name], values)
+
+
+def _write(tmp_path, format):
+    path = tmp_path / f"specs.{format}"
+    if format == "csv":
+        lines = ["name,spec"] + [f'{k},"{v}"' for k, v in SPECS.items()]
+        path.write_text("\n".join(lines) + "\n")
+    elif format == "json":
+        path.write_text(json.dumps(SPECS))
+    else:
+        path.write_text("".join(f'{k}: "{v}"\n' for k, v in SPECS.items()))
+    return path
+
+
+@pytest.mark.parametrize("format", ["csv", "json", "yml"])
+def test_read_specs(tmp_path, format):
+    if format == "yml":
+        pytest.importorskip("yaml")
+    path = _write(tmp_path, format)
+    assert read_specs(path) == SPECS
+    _assert_builds_like(load_measurand_set(path), SPECS)
+
+
+def test_read_specs_list(tmp_path):
+    path = tmp_path / "specs.txt"
+    path.write_text(json.dumps(list(SPECS.values())))
+    with pytest.raises(ValueError):
+        read_specs(path)
+    specs = read_specs(path, format="json")
+    assert specs == {str(i): v for i, v in enumerate(SPECS.values())}
+
+
+@pytest.mark.parametrize("word_size, one_based", [(8, True), (8, False), (16, True)])
+def test_parse_specs(word_size, one_based):
+    # "c" is a 32-bit interp, which needs 8-bit words
+    specs = {k: v for k, v in SPECS.items() if word_size == 8 or k != "c"}
+    ms = parse_specs(specs, word_size=word_size, one_based=one_based)
+    _assert_builds_like(ms, specs, word_size=word_size, one_based=one_based)
+
+
+def test_parse_specs_shares_models():
+    ms = parse_specs(SPECS)
+    m = ms.measurands
+    assert m["b"].parameter is m["f"].parameter
+    assert m["a"].parameter is m["e"].parameter
+    assert m["a"].interp is m["e"].interp
+    assert m["a"].parameter.components[0] is m["d"].parameter.components[0]
+
+
+def test_parse_specs_invalid():
+    with pytest.raises(ValueError):
+        parse_specs(["1-2;2c", "x-2"])
+    with pytest.raises(ValueError):
+        parse_specs(["1-2;2c;EUC[a,b,c,d]"])
+
+
+def test_save_measurand_set(tmp_path):
+    ms = parse_specs(SPECS)
+    ms.build(DATA)
+    path = tmp_path / "specs.db"
+    save_measurand_set(ms, path)
+    loaded = load_measurand_set(path)
+    _assert_builds_like(loaded, SPECS)
+    m = loaded.measurands
+    assert m["b"].parameter is m["f"].parameter
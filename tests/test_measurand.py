@@ -1,3 +1,6 @@
+import pickle
+
+import numpy as np
 import pytest
 
 from measurand.measurand import make_measurand
@@ -12,6 +15,16 @@ def test_measurand_size(case: Example):
     assert r.size == case.size
 
 
+@pytest.mark.parametrize("spec", ["1-2;2c", "1-4;ieee32;EUC[2]", "1-2;u;POLY[1,2]"])
+@pytest.mark.parametrize("fused", [False, True])
+def test_measurand_pickle(spec, fused):
+    m = make_measurand(spec, fused=fused)
+    expected = m.build(SAMPLE_NDARRAY[8])
+    result = pickle.loads(pickle.dumps(m))
+    assert result == m
+    np.testing.assert_array_equal(result.build(SAMPLE_NDARRAY[8]), expected)
+
+
 @pytest.mark.parametrize("case", parameter_test_cases)
 class TestBuildMeasurand:
     def test_build_ndarray(self, case: Example):
@@ -0,0 +1,144 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from measurand.measurand import make_measurand
+from measurand.measurand_set import MeasurandSet, make_measurand_set
+from measurand.sampling import Sampling
+
+from .cases import parameter_test_cases
+from .conftest import ARRAY_SIZE, SAMPLE_NDARRAY, SAMPLE_PAARRAY
+
+WORD_SIZES = [8, 10, 12]
+
+
+def _cases(word_size: int) -> dict:
+    return {
+        f"m{i}": case
+        for i, case in enumerate(parameter_test_cases)
+        if case.word_size == word_size and case.one_based
+    }
+
+
+@pytest.mark.parametrize("word_size", WORD_SIZES)
+class TestBuildMeasurandSet:
+    def test_build_ndarray(self, word_size):
+        cases = _cases(word_size)
+        ms = make_measurand_set(
+            {name: case.spec for name, case in cases.items()}, word_size=word_size
+        )
+        out = ms.build(SAMPLE_NDARRAY[word_size])
+        assert set(out) == set(cases)
+        for name, case in cases.items():
+            assert list(out[name]) == [case.result] * ARRAY_SIZE
+
+    def test_build_paarray(self, word_size):
+        cases = _cases(word_size)
+        ms = make_measurand_set(
+            {name: case.spec for name, case in cases.items()}, word_size=word_size
+        )
+        out = ms.build(SAMPLE_PAARRAY[word_size])
+        assert isinstance(out, pa.Table)
+        assert out.column_names == list(cases)
+        for name, case in cases.items():
+            assert out[name].to_pylist() == [case.result] * ARRAY_SIZE
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "1-2;2c",
+        "1-4;ieee32;EUC[1.5,2,3]",
+        "3+4;1c;EUC[2]",
+        "5:1-4R+6;u;[0.5,4]",
+    ],
+)
+def test_measurand_set_matches_measurand(spec):
+    data = SAMPLE_NDARRAY[8]
+    ms = make_measurand_set([spec, "1-4;ieee32", "3+4", spec])
+    out = ms.build(data)
+    expected = make_measurand(spec).build(data)
+    assert out["0"].tolist() == expected.tolist()
+    assert out["3"].tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize("byteorder", ["<", ">"])
+def test_measurand_set_word_runs(byteorder):
+    data = np.random.default_rng(0).integers(0, 2**16, (100, 8), dtype="u2")
+    data = data.astype(data.dtype.newbyteorder(byteorder))
+    specs = ["1-2", "4+3+2+1", "2-3;2c", "5:1-12+6"]
+    ms = make_measurand_set(specs, word_size=16)
+    assert ms._gathered_words == (4, 5)
+    out = ms.build(data)
+    for name, spec in zip(out, specs):
+        expected = make_measurand(spec, word_size=16).build(data)
+        assert out[name].tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize("dtype", ["i8", "u2"])
+def test_measurand_set_word_runs_wide_input(dtype):
+    # Runs of 8-bit words are not views of input with wider elements
+    data = np.random.default_rng(0).integers(0, 256, (100, 8), dtype="u1")
+    specs = ["2-1", "4-1;ieee32", "1-2;2c"]
+    out = make_measurand_set(specs).build(data.astype(dtype))
+    expected = make_measurand_set(specs).build(data)
+    for name in expected:
+        np.testing.assert_array_equal(out[name], expected[name])
+
+
+def test_measurand_set_shares_identical_stages():
+    ms = make_measurand_set(["1-2;2c", "1+2;2c", "1-2;2c;EUC[2]", "1-2"])
+    out = ms.build(SAMPLE_NDARRAY[8])
+    assert out["0"] is out["1"]
+    assert out["2"] is not out["0"]
+    assert out["2"].tolist() == (out["0"].astype("f8") * 2).tolist()
+    assert out["3"].tolist() == [0x0102] * ARRAY_SIZE
+
+
+def test_measurand_set_masked():
+    data = np.ma.MaskedArray(np.arange(40, dtype="u1").reshape(10, 4), mask=False)
+    data[2, 1] = np.ma.masked
+    ms = make_measurand_set({"a": "1-2;2c", "b": "3;u;EUC[2]", "c": "1-4"})
+    out = ms.build(data)
+    for name, spec in [("a", "1-2;2c"), ("b", "3;u;EUC[2]"), ("c", "1-4")]:
+        expected = make_measurand(spec).build(data)
+        assert isinstance(out[name], np.ma.MaskedArray)
+        assert out[name].data.tolist() == expected.data.tolist()
+        assert np.ma.getmaskarray(out[name]).tolist() == (
+            np.ma.getmaskarray(expected).tolist()
+        )
+    assert np.ma.getmaskarray(out["a"]).tolist() == [i == 2 for i in range(10)]
+    assert not np.ma.getmaskarray(out["b"]).any()
+
+
+def test_measurand_set_mixed_windows():
+    m = make_measurand("1-2")
+    ms = MeasurandSet(
+        measurands={
+            "a": m,
+            "b": m.model_copy(update={"sampling": Sampling(window=3, mode="max")}),
+        }
+    )
+    out = ms.build(SAMPLE_NDARRAY[8][:10])
+    assert out["a"].tolist() == [0x0102] * 10
+    assert out["b"].tolist() == [0x0102] * 4
+
+    with pytest.raises(ValueError, match="sampling windows"):
+        ms.build(SAMPLE_PAARRAY[8].slice(0, 10))
+
+    # A single window, other than 1, still builds a table
+    ms = MeasurandSet(measurands={"b": ms.measurands["b"]})
+    assert ms.build(SAMPLE_PAARRAY[8].slice(0, 10))["b"].to_pylist() == [0x0102] * 4
+
+
+def test_measurand_set_from_list():
+    m = make_measurand("1-2")
+    ms = MeasurandSet(measurands=[m, m])
+    assert len(ms) == 2
+    assert ms.words == (0, 1)
+
+
+def test_measurand_set_invalid_input():
+    ms = make_measurand_set(["1"])
+    with pytest.raises(TypeError):
+        ms.build(np.zeros(10).tolist())
@@ -1,9 +1,14 @@
+import sys
+
+import numpy as np
+import pyarrow as pa
 import pytest
 from hypothesis import assume, given
 from hypothesis import strategies as st
 
 from measurand.component import make_component
 from measurand.parameter import make_parameter
+from measurand.utils import _numpy_2d_array_to_arrow_table
 
 from . import strategies as cst
 from .cases import Example, component_test_cases, parameter_test_cases
@@ -85,3 +90,178 @@ class TestBuildParameter:
 
         out = p.build(SAMPLE_PAARRAY[case.word_size])
         assert out.to_pylist() == list([case.result] * ARRAY_SIZE)
+
+
+@given(cst.parameter_spec())
+def test_parameter_hash(spec):
+    p1 = make_parameter(spec)
+    p2 = make_parameter(spec)
+    assert hash(p1) == hash(p2)
+    assert len({p1, p2}) == 1
+
+
+def test_parameter_hash_range():
+    assert hash(make_parameter("1-3")) == hash(make_parameter("1+2+3"))
+
+
+def _pack_bits(data, word_size: int) -> str:
+    return "".join(f"{word:0{word_size}b}" for word in data.ravel().tolist())
+
+
+def _bits_to_bytes(bits: str):
+    bits += "0" * (-len(bits) % 8)
+    return np.frombuffer(int(bits, 2).to_bytes(len(bits) // 8, "big"), np.uint8)
+
+
+@pytest.mark.parametrize("case", parameter_test_cases)
+def test_build_bitstream(case: Example):
+    p = make_parameter(case.spec, word_size=case.word_size, one_based=case.one_based)
+    data = SAMPLE_NDARRAY[case.word_size][:10]
+    frame_bits = data.shape[1] * case.word_size
+    stream = _bits_to_bytes(_pack_bits(data, case.word_size))
+    out = p.build_bitstream(stream, frame_bits)
+    assert out.tolist() == [case.result] * 10
+
+
+@pytest.mark.parametrize("frame_words", [5, 8, 9])
+@pytest.mark.parametrize("word_size", [8, 10, 12])
+@pytest.mark.parametrize("spec", ["1", "2-3", "5:1-4R+1:3-7", "4R+2:2"])
+def test_build_bitstream_random(spec, word_size, frame_words):
+    rng = np.random.default_rng(word_size)
+    data = rng.integers(0, 2**word_size, (50, frame_words), dtype="u2")
+    p = make_parameter(spec, word_size=word_size)
+    expected = p.build(data).tolist()
+
+    frame_bits = frame_words * word_size
+    stream = _bits_to_bytes(_pack_bits(data, word_size))
+    assert p.build_bitstream(stream, frame_bits).tolist() == expected
+
+    frames = np.stack([_bits_to_bytes(_pack_bits(frame, word_size)) for frame in data])
+    assert p.build_bitstream(frames).tolist() == expected
+
+
+@pytest.mark.parametrize("spec", ["2", "3R", "1:5-64", "1:1-60+2:3-6"])
+def test_build_bitstream_64_bit_words(spec):
+    data = np.random.default_rng(0).integers(0, 2**64, (20, 3), dtype="u8")
+    p = make_parameter(spec, word_size=64)
+    expected = p.build(data).tolist()
+    frames = data.astype(">u8").view("u1")
+    assert p.build_bitstream(frames).tolist() == expected
+
+    # Frames of a length other than a whole number of bytes misalign the words
+    stream = _bits_to_bytes("".join(_pack_bits(row, 64) + "0000" for row in data))
+    assert p.build_bitstream(stream, 196).tolist() == expected
+
+
+@pytest.mark.parametrize("spec", ["10", "5:1-4"])
+def test_build_bitstream_past_frame(spec):
+    p = make_parameter(spec)
+    with pytest.raises(IndexError):
+        p.build_bitstream(np.zeros((2, 4), dtype=np.uint8))
+    # Fields must not be read from the next frame of a 1-D stream
+    with pytest.raises(IndexError):
+        p.build_bitstream(np.zeros(12, dtype=np.uint8), frame_bits=28)
+
+
+def test_build_bitstream_requires_frame_bits():
+    with pytest.raises(ValueError):
+        make_parameter("1").build_bitstream(np.zeros(8, dtype=np.uint8))
+
+
+def _reference(p, row) -> int:
+    result = 0
+    for comp in p.components:
+        value = int(row[comp.word])
+        if comp.mask:
+            value &= comp.mask
+        value >>= comp.shift
+        if comp.reverse:
+            value = int(f"{value:0{comp.size}b}"[::-1], 2)
+        result = (result << comp.size) | value
+    return result
+
+
+@pytest.mark.parametrize(
+    "layout", ["native", "swapped", "fortran", "strided", "int64", "uint16"]
+)
+@pytest.mark.parametrize(
+    "spec, word_size, word_run",
+    [
+        ("1-2", 8, (0, 2, ">")),
+        ("4+3+2+1", 8, (0, 4, "<")),
+        ("2-9", 8, (1, 8, ">")),
+        ("2-3", 16, (1, 2, ">")),
+        ("3+2", 32, (1, 2, "<")),
+        ("1-3", 8, None),
+        ("1+3", 8, None),
+        ("2R+3", 8, None),
+        ("5:1-4R+4+1:3-7", 8, None),
+        ("1:1-8+2", 8, (0, 2, ">")),
+        ("1:1-4+2", 16, None),
+        ("1", 64, None),
+    ],
+)
+def test_build_ndarray_layouts(spec, word_size, word_run, layout):
+    rng = np.random.default_rng(word_size)
+    data = rng.integers(0, 2**64 - 1, (100, 10), dtype="u8", endpoint=True)
+    data = (data >> np.uint8(64 - word_size)).astype(f"u{word_size // 8}")
+    if layout == "swapped":
+        data = data.astype(data.dtype.newbyteorder("S"))
+    elif layout == "fortran":
+        data = np.asfortranarray(data)
+    elif layout == "strided":
+        data = data[::3]
+    elif layout in ("int64", "uint16"):
+        # Elements wider or narrower than a word hold the words as integers
+        data = data.astype(layout)
+
+    p = make_parameter(spec, word_size=word_size)
+    assert p._word_run == word_run
+    out = p.build(data)
+    assert out.dtype == p.output_dtype
+    words = data.astype(f"u{word_size // 8}")
+    expected = [_reference(p, row) for row in words.tolist()]
+    assert out.tolist() == expected
+
+    table = _numpy_2d_array_to_arrow_table(data.astype(data.dtype.newbyteorder("=")))
+    out = p.build(table.slice(1))
+    assert out.type == pa.from_numpy_dtype(p.output_dtype)
+    assert out.to_pylist() == expected[1:]
+
+
+@pytest.mark.parametrize("word_size", [8, 16])
+def test_build_ndarray_word_run_view(word_size):
+    data = np.arange(40, dtype=f"u{word_size // 8}").reshape(10, 4)
+    native, swapped = ("4+3+2+1", "1-4")[:: 1 if sys.byteorder == "little" else -1]
+
+    # A run in the native byte order is a view of the input
+    p = make_parameter(native, word_size=word_size)
+    out = p.build(data)
+    assert np.shares_memory(out, data)
+    assert out.tolist() == [_reference(p, row) for row in data.tolist()]
+
+    # Other runs are copied once, with their bytes swapped
+    p = make_parameter(swapped, word_size=word_size)
+    if word_size > 8:
+        # Multi-byte words must be in the byte order of the run
+        assert p._view_word_run(data) is None
+        data = data.astype(data.dtype.newbyteorder("S"))
+    out = p.build(data)
+    assert not np.shares_memory(out, data)
+    assert out.dtype == p.output_dtype
+    assert out.tolist() == [_reference(p, row) for row in data.tolist()]
+
+
+def test_build_masked():
+    data = np.ma.MaskedArray(np.arange(40, dtype="u1").reshape(10, 4), mask=False)
+    data[2, 1] = np.ma.masked
+    data[5, 3] = np.ma.masked
+    p = make_parameter("1-2")
+    out = p.build(data)
+    assert isinstance(out, np.ma.MaskedArray)
+    assert out.data.tolist() == p.build(data.data).tolist()
+    assert np.ma.getmaskarray(out).tolist() == [i == 2 for i in range(10)]
+
+    # Input without masked values builds an unmasked result
+    out = p.build(np.ma.MaskedArray(data.data))
+    assert not np.ma.getmaskarray(out).any()
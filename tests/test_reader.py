@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from measurand.measurand import make_measurand
+from measurand.reader import FrameFile
+from measurand.utils import _size_to_uint
+
+from .conftest import SAMPLE_NDARRAY
+
+
+def _pack(data: np.ndarray, word_size: int, byteorder: str = ">") -> bytes:
+    if word_size % 8 == 0:
+        dtype = np.dtype(_size_to_uint(word_size)).newbyteorder(byteorder)
+        return data.astype(dtype).tobytes()
+    frame_bits = data.shape[1] * word_size
+    frame_bytes = (frame_bits + 7) // 8
+    out = b""
+    for frame in data.tolist():
+        value = 0
+        for word in frame:
+            value = (value << word_size) | word
+        value <<= frame_bytes * 8 - frame_bits
+        out += value.to_bytes(frame_bytes, "big")
+    return out
+
+
+def _frame_file(tmp_path, data, word_size, byteorder=">", header=b""):
+    path = tmp_path / "frames.bin"
+    path.write_bytes(header + _pack(data, word_size, byteorder))
+    return FrameFile(
+        path=path,
+        frame_length=data.shape[1],
+        word_size=word_size,
+        byteorder=byteorder,
+        offset=len(header),
+    )
+
+
+@pytest.mark.parametrize("word_size", [8, 10, 12])
+def test_read_sample(tmp_path, word_size):
+    data = SAMPLE_NDARRAY[word_size]
+    ff = _frame_file(tmp_path, data, word_size, header=b"HDR")
+    assert len(ff) == data.shape[0]
+    assert ff.packed == (word_size != 8)
+    np.testing.assert_array_equal(ff.read(), data)
+    np.testing.assert_array_equal(ff.read(10, 20), data[10:20])
+    np.testing.assert_array_equal(np.concatenate(list(ff.iter_chunks(33))), data)
+
+
+@pytest.mark.parametrize("word_size", [8, 16, 32])
+@pytest.mark.parametrize("byteorder", [">", "<"])
+def test_frames_zero_copy(tmp_path, word_size, byteorder):
+    rng = np.random.default_rng(word_size)
+    data = rng.integers(0, 2**word_size, (50, 12), dtype=_size_to_uint(word_size))
+    ff = _frame_file(tmp_path, data, word_size, byteorder)
+    assert isinstance(ff.frames.base, np.memmap) or isinstance(ff.frames, np.memmap)
+    np.testing.assert_array_equal(ff.frames, data)
+
+
+def test_frames_packed(tmp_path):
+    ff = _frame_file(tmp_path, SAMPLE_NDARRAY[12], 12)
+    with pytest.raises(ValueError):
+        ff.frames
+
+
+@pytest.mark.parametrize(
+    "spec, word_size",
+    [
+        ("1-2;2c", 16),
+        ("3:1-4R+4", 16),
+        ("2R+5", 16),
+        ("1-2;ieee32;EUC[2]", 16),
+        ("1-3", 10),
+        ("7:3-9R+1", 12),
+    ],
+)
+def test_build_from_frame_file(tmp_path, spec, word_size):
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 2**word_size, (64, 8), dtype=_size_to_uint(word_size))
+    ff = _frame_file(tmp_path, data, word_size)
+    m = make_measurand(spec, word_size=word_size)
+    expected = m.build(data)
+    np.testing.assert_array_equal(m.build(ff.read()), expected)
+    chunks = list(m.build_chunks(ff.iter_chunks(10)))
+    np.testing.assert_array_equal(np.concatenate(chunks), expected)
+
+
+@pytest.mark.parametrize("word_size", [8, 10, 12])
+def test_build_bitstream_from_frame_file(tmp_path, word_size):
+    data = SAMPLE_NDARRAY[word_size]
+    ff = _frame_file(tmp_path, data, word_size)
+    m = make_measurand("3-5;u;EUC[2]", word_size=word_size)
+    expected = m.build(data)
+    np.testing.assert_array_equal(m.build_bitstream(ff.read_bitstream()), expected)
+    chunks = [m.build_bitstream(c) for c in ff.iter_chunks(30, bitstream=True)]
+    np.testing.assert_array_equal(np.concatenate(chunks), expected)
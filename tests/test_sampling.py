@@ -0,0 +1,150 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from measurand.euc import ScaleFactorEUC
+from measurand.measurand import make_measurand
+from measurand.sampling import Sampling
+
+from .conftest import SAMPLE_NDARRAY, SAMPLE_PAARRAY
+
+REFERENCE = {
+    "mean": np.mean,
+    "max": np.max,
+    "min": np.min,
+    "mode": lambda x: sorted(x.tolist(), key=lambda v: (-x.tolist().count(v), v))[0],
+}
+
+
+def _reference(data: np.ndarray, window: int, mode: str) -> list:
+    return [
+        REFERENCE[mode](data[i : i + window]) for i in range(0, len(data), window)
+    ]
+
+
+@pytest.mark.parametrize("mode", ["mean", "mode", "max", "min"])
+@given(
+    st.lists(st.integers(min_value=0, max_value=7), min_size=1, max_size=50),
+    st.integers(min_value=1, max_value=10),
+)
+@settings(deadline=None)
+def test_sampling_ndarray(mode, values, window):
+    data = np.array(values, dtype="u1")
+    result = Sampling(window=window, mode=mode).apply_ndarray(data, 8)
+    assert result.tolist() == pytest.approx(_reference(data, window, mode))
+
+
+@pytest.mark.parametrize("mode", ["mean", "mode", "max", "min"])
+@given(
+    st.lists(st.integers(min_value=0, max_value=7), min_size=1, max_size=50),
+    st.integers(min_value=1, max_value=10),
+)
+@settings(deadline=None)
+def test_sampling_paarray(mode, values, window):
+    data = np.array(values, dtype="u1")
+    result = Sampling(window=window, mode=mode).apply_paarray(pa.array(data), 8)
+    assert result.to_pylist() == pytest.approx(_reference(data, window, mode))
+
+
+@pytest.mark.parametrize("mode", ["mean", "mode", "max", "min"])
+@given(
+    st.lists(
+        st.one_of(st.none(), st.integers(min_value=0, max_value=7)),
+        min_size=1,
+        max_size=50,
+    ),
+    st.integers(min_value=1, max_value=10),
+)
+@settings(deadline=None)
+def test_sampling_invalid_values(mode, values, window):
+    # Masked or null values are left out of their window
+    expected = []
+    for i in range(0, len(values), window):
+        valid = [v for v in values[i : i + window] if v is not None]
+        expected.append(REFERENCE[mode](np.array(valid)) if valid else None)
+
+    sampling = Sampling(window=window, mode=mode)
+    data = np.ma.MaskedArray(
+        [0 if v is None else v for v in values],
+        mask=[v is None for v in values],
+        dtype="u1",
+    )
+    result = sampling.apply_ndarray(data, 8)
+    assert np.ma.getmaskarray(result).tolist() == [v is None for v in expected]
+    assert [v for v in np.ma.getdata(result)[~np.ma.getmaskarray(result)]] == (
+        pytest.approx([v for v in expected if v is not None])
+    )
+
+    result = sampling.apply_paarray(pa.array(values, pa.uint8()), 8)
+    assert result.to_pylist() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("window", [0, -4])
+def test_sampling_invalid_window(window):
+    with pytest.raises(ValueError):
+        Sampling(window=window, mode="mean")
+
+
+@pytest.mark.parametrize(
+    "mode, scale_factor, before",
+    [
+        ("mean", -2.0, True),
+        ("mode", 2.0, True),
+        ("mode", 0.0, False),
+        ("mode", -1.0, False),
+        ("max", 2.0, True),
+        ("max", -2.0, False),
+        ("min", -2.0, False),
+    ],
+)
+def test_sampling_commutes_with_euc(mode, scale_factor, before):
+    sampling = Sampling(window=4, mode=mode)
+    assert sampling._commutes_with(None)
+    euc = ScaleFactorEUC(scale_factor=scale_factor)
+    assert sampling._commutes_with(euc) is before
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_measurand_sampling_mode_negative_scale(fused):
+    # Ties resolve to the smallest value after the EUC, not before it
+    data = np.array([[1], [1], [2], [2]], dtype="u1")
+    m = make_measurand("1;u;EUC[-1]", fused=fused)
+    m = m.model_copy(update={"sampling": Sampling(window=4, mode="mode")})
+    assert m.build(data).tolist() == [-2.0]
+
+
+@pytest.mark.parametrize("mode", ["mean", "mode", "max", "min"])
+@pytest.mark.parametrize("fused", [False, True])
+def test_measurand_sampling(mode, fused):
+    data = SAMPLE_NDARRAY[8].copy()
+    data[:, 0] = np.arange(len(data)) % 7
+    m = make_measurand("1;u;EUC[-2,3]", fused=fused)
+    m = m.model_copy(update={"sampling": Sampling(window=8, mode=mode)})
+    expected = _reference(make_measurand("1;u;EUC[-2,3]").build(data), 8, mode)
+    assert m.build(data).tolist() == pytest.approx(expected)
+    assert m.build(
+        pa.Table.from_arrays([pa.array(col) for col in data.T], names=["0"] * 256)
+    ).to_pylist() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("mode", ["mean", "mode", "max", "min"])
+def test_measurand_sampling_float16(mode):
+    # float16 values are reduced as float32, which holds every one exactly
+    data = np.random.default_rng(0).integers(0, 0x7C, (64, 2), dtype="u1")
+    m = make_measurand("1-2;ieee16")
+    m = m.model_copy(update={"sampling": Sampling(window=8, mode=mode)})
+    expected = _reference(make_measurand("1-2;ieee16").build(data), 8, mode)
+    result = m.build(data)
+    assert result.dtype == np.float16
+    assert result.tolist() == pytest.approx(expected, rel=1e-3)
+    table = pa.Table.from_arrays([pa.array(col) for col in data.T], names=["0", "1"])
+    assert m.build(table).to_pylist() == pytest.approx(expected, rel=1e-3)
+
+
+def test_measurand_sampling_sample_data():
+    m = make_measurand("1-2")
+    m = m.model_copy(update={"sampling": Sampling(window=30, mode="max")})
+    assert m.build(SAMPLE_NDARRAY[8]).tolist() == [0x0102] * 4
+    assert m.build(SAMPLE_PAARRAY[8]).to_pylist() == [0x0102] * 4
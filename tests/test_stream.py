@@ -0,0 +1,64 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from measurand.measurand import make_measurand
+from measurand.measurand_set import MeasurandSet
+from measurand.sampling import Sampling
+from measurand.utils import _numpy_2d_array_to_arrow_table
+
+from .conftest import FRAME_SPECS
+
+
+def _split(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("spec", list(FRAME_SPECS.values()))
+@pytest.mark.parametrize("size", [1, 7, 100, 1000, 5000])
+def test_build_chunks_ndarray(spec, size, frames):
+    m = make_measurand(spec)
+    chunks = list(m.build_chunks(iter(_split(frames, size))))
+    assert len(chunks) == -(-len(frames) // size)
+    np.testing.assert_array_equal(np.concatenate(chunks), m.build(frames))
+
+
+@pytest.mark.parametrize("spec", list(FRAME_SPECS.values()))
+@pytest.mark.parametrize("size", [1, 7, 100, 1000])
+def test_build_chunks_record_batch(spec, size, frames):
+    m = make_measurand(spec)
+    table = _numpy_2d_array_to_arrow_table(frames)
+    chunks = m.build_chunks(table.to_batches(max_chunksize=size))
+    result = pa.chunked_array(chunks).to_pylist()
+    assert result == pytest.approx(m.build(table).to_pylist(), nan_ok=True)
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 1000])
+@pytest.mark.parametrize("mode", ["mean", "mode", "max", "min"])
+def test_build_chunks_sampling(size, mode, frames):
+    m = make_measurand("1-2;2c;EUC[2]")
+    m = m.model_copy(update={"sampling": Sampling(window=16, mode=mode)})
+    chunks = list(m.build_chunks(_split(frames, size)))
+    np.testing.assert_array_equal(np.concatenate(chunks), m.build(frames))
+
+    table = _numpy_2d_array_to_arrow_table(frames)
+    chunks = m.build_chunks(table.to_batches(max_chunksize=size))
+    result = pa.chunked_array(chunks).to_pylist()
+    assert result == pytest.approx(m.build(table).to_pylist())
+
+
+def test_measurand_set_build_chunks(frames):
+    m = make_measurand("1-2;u")
+    ms = MeasurandSet(
+        measurands={
+            "a": m,
+            "b": m.model_copy(update={"sampling": Sampling(window=4, mode="min")}),
+            "c": m.model_copy(update={"sampling": Sampling(window=6, mode="max")}),
+        }
+    )
+    assert ms._window == 12
+    chunks = list(ms.build_chunks(_split(frames, 50)))
+    expected = ms.build(frames)
+    for name in expected:
+        result = np.concatenate([chunk[name] for chunk in chunks])
+        np.testing.assert_array_equal(result, expected[name])
@@ -0,0 +1,95 @@
+import importlib
+import subprocess
+import sys
+from functools import lru_cache
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from numba import vectorize
+
+from measurand.types import jfunc, ufunc
+from measurand.utils import _size_to_uint
+
+from . import strategies as cst
+
+FLOAT_KERNELS = [
+    ("milstd1750a32", 32),
+    ("milstd1750a48", 48),
+    ("ti32", 32),
+    ("ti40", 40),
+    ("ibm32", 32),
+    ("ibm64", 64),
+    ("dec32", 32),
+    ("dec64", 64),
+    ("dec64g", 64),
+    ("bcd", 64),
+]
+
+
+@lru_cache(maxsize=None)
+def _reference(name: str) -> np.ufunc:
+    module = importlib.import_module(f"measurand.types.{name}")
+    return vectorize(module.signatures)(module.reference_func)
+
+
+def _assert_bit_exact(result: np.ndarray, expected: np.ndarray) -> None:
+    assert result.dtype == expected.dtype
+    dtype = f"u{result.dtype.itemsize}"
+    np.testing.assert_array_equal(result.view(dtype), expected.view(dtype))
+
+
+def test_import_does_not_compile():
+    code = (
+        "import measurand.types.jfunc, measurand.types.ufunc, measurand.types.ti32\n"
+        "from numba.core.registry import CPUDispatcher\n"
+        "import measurand.types.ti32 as module\n"
+        "assert 'jfunc' not in vars(module) and 'ufunc' not in vars(module)\n"
+        "assert isinstance(module.jfunc, CPUDispatcher)\n"
+        "assert 'jfunc' in vars(module) and 'ufunc' not in vars(module)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("name", jfunc.__all__)
+def test_aggregates(name):
+    module = importlib.import_module(f"measurand.types.{name}")
+    assert getattr(jfunc, name) is module.jfunc
+    assert getattr(ufunc, name) is module.ufunc
+
+
+@pytest.mark.parametrize(
+    "module", [jfunc, ufunc, importlib.import_module("measurand.types.bcd")]
+)
+def test_unknown_attribute(module):
+    with pytest.raises(AttributeError):
+        module.unknown
+
+
+@settings(deadline=None)
+@given(data=st.data())
+@pytest.mark.parametrize("name, bits", FLOAT_KERNELS)
+def test_matches_reference(name, bits, data):
+    values = data.draw(st.lists(cst.uint(bits), min_size=1, max_size=100))
+    values = np.array(values, dtype="u8").astype(_size_to_uint(bits))
+    with np.errstate(all="ignore"):
+        _assert_bit_exact(getattr(ufunc, name)(values), _reference(name)(values))
+
+
+@pytest.mark.parametrize("name, bits", FLOAT_KERNELS)
+def test_matches_reference_bulk(name, bits):
+    values = np.random.default_rng(bits).integers(0, 2**bits, 100_000, dtype="u8")
+    values = values.astype(_size_to_uint(bits))
+    with np.errstate(all="ignore"):
+        _assert_bit_exact(getattr(ufunc, name)(values), _reference(name)(values))
+
+
+@settings(deadline=None)
+@given(cst.uint_and_size())
+@pytest.mark.parametrize("name", ["onescomp", "twoscomp"])
+def test_signed_matches_reference(name, things):
+    uint, size = things
+    values = np.array([uint, 0, 2**size - 1], dtype=_size_to_uint(size))
+    result = getattr(ufunc, name)(values, np.uint8(size))
+    _assert_bit_exact(result, _reference(name)(values, np.uint8(size)))
@@ -1,15 +1,17 @@
 import numpy as np
 import pyarrow as pa
 import pytest
-from hypothesis import assume, given
+from hypothesis import assume, given, settings
 from hypothesis import strategies as st
 
 from measurand.utils import (
     _bit_range_to_mask_and_shift,
     _expand_component_range,
     _expand_list,
+    _map_columns,
     _range_to_tuple,
     _reverse_bits_ndarray,
+    _reverse_bits_numba,
     _reverse_bits_paarray,
     _size_to_uint,
 )
@@ -166,8 +168,67 @@ class TestReverseBits:
             [output] * ARRAY_SIZE
         )
 
+    def test_numba(self, input, output, dtype, word_size):
+        data = np.array([input] * ARRAY_SIZE, dtype=dtype)
+        assert list(_reverse_bits_numba(data, word_size)) == list(
+            [output] * ARRAY_SIZE
+        )
+
     def test_paarray(self, input, output, dtype, word_size):
         data = pa.array([input] * ARRAY_SIZE, type=dtype)
         assert _reverse_bits_paarray(data, word_size).to_pylist() == list(
             [output] * ARRAY_SIZE
         )
+
+
+@given(st.integers(min_value=1, max_value=64), st.data())
+@settings(deadline=None)
+def test_reverse_bits_any_size(size, data):
+    value = data.draw(st.integers(min_value=0, max_value=2**size - 1))
+    expected = int(f"{value:0{size}b}"[::-1], 2)
+    dtype = _size_to_uint(size)
+    for order in "<>":
+        x = np.array([value] * 3, dtype=np.dtype(dtype).newbyteorder(order))
+        assert _reverse_bits_ndarray(x, size).tolist() == [expected] * 3
+    x = np.array([value] * 3, dtype=dtype)
+    assert _reverse_bits_numba(x, size).tolist() == [expected] * 3
+
+
+def test_reverse_bits_paarray_nulls_and_chunks():
+    values = [0x01, None, 0x0F, 0xF0, None, 0x80, 0x55]
+    expected = [None if v is None else int(f"{v:08b}"[::-1], 2) for v in values]
+    arr = pa.array(values, type=pa.uint8())
+    assert _reverse_bits_paarray(arr, 8).to_pylist() == expected
+    assert _reverse_bits_paarray(arr.slice(3), 8).to_pylist() == expected[3:]
+
+    chunked = pa.chunked_array([arr.slice(0, 2), arr.slice(2, 3), arr.slice(5)])
+    result = _reverse_bits_paarray(chunked, 8)
+    assert isinstance(result, pa.ChunkedArray)
+    assert [len(c) for c in result.chunks] == [2, 3, 2]
+    assert result.to_pylist() == expected
+
+    empty = pa.chunked_array([], type=pa.uint16())
+    assert _reverse_bits_paarray(empty, 12).type == pa.uint16()
+
+
+def test_map_columns_nulls_and_chunks():
+    a = pa.chunked_array(
+        [pa.array([1, None, 3], pa.uint8()), pa.array([4, 5, 6, 7], pa.uint8())]
+    )
+    b = pa.array([10, 20, 30, 40, None, 60, 70, 80], pa.uint16()).slice(1)
+    c = pa.array(range(7), pa.uint8())
+    table = pa.table({"a": a, "b": b, "c": c})
+
+    result = _map_columns(table, [1, 0], lambda cols: cols[0] + cols[1])
+    assert isinstance(result, pa.ChunkedArray)
+    assert [len(chunk) for chunk in result.chunks] == [3, 4]
+    assert result.type == pa.uint16()
+    assert result.to_pylist() == [21, None, 43, None, 65, 76, 87]
+
+    result = _map_columns(table.slice(2), [2], lambda cols: cols[0] * 2.0)
+    assert result.to_pylist() == [4.0, 6.0, 8.0, 10.0, 12.0]
+
+    empty = table.slice(0, 0)
+    assert _map_columns(empty, [0, 1], lambda cols: cols[0] + cols[1]).type == (
+        pa.uint16()
+    )